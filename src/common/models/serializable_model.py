@@ -17,6 +17,20 @@ class SerializableModel(BaseModel, ToJsonMixin, FromJsonMixin):
         """Convert the model to a JSON string."""
         return self.model_dump_json(indent=2)
 
+    def to_json_bytes(self) -> bytes:
+        """Convert the model to UTF-8 encoded JSON bytes, using the model's to_json()."""
+        return self.to_json().encode("utf-8")
+
+    def write_to_file(self, file_path: Path) -> Path:
+        """
+        Write the model as JSON to the specified file path, overwriting it if it exists.
+        The file is written in binary mode, so it always gets LF line endings (even on Windows).
+        """
+        with open(file_path, "wb") as f:
+            f.write(self.to_json_bytes())
+
+        return file_path
+
     def save_to_file(self, directory: Path) -> Path:
         """
         Save the model to a JSON file in the specified directory.
@@ -1,12 +1,16 @@
 from pathlib import Path
 from typing import Optional, Union
 
-from pydantic import Field, field_serializer, field_validator
+from pydantic import Field, PrivateAttr, field_serializer, field_validator
 
 from src.common.enums import Country, VehicleType
 from .battle_rating import BattleRating
 from src.common.models.serializable_model import SerializableModel
 
+# Enum value lookups, built once so validation doesn't scan the enums per vehicle
+_COUNTRY_BY_VALUE: dict[str, Country] = {country.value: country for country in Country}
+_VEHICLE_TYPE_BY_VALUE: dict[str, VehicleType] = {vehicle_type.value: vehicle_type for vehicle_type in VehicleType}
+
 
 class Vehicle(SerializableModel):
     """Represents a vehicle in War Thunder."""
@@ -18,11 +22,17 @@ class Vehicle(SerializableModel):
     battle_rating: BattleRating = Field(default_factory=BattleRating)
     is_premium: bool = Field(description="Indicates if the vehicle is a premium vehicle")
 
+    _hash: int = PrivateAttr()
+
     # Lifecycle
 
     def __init__(self, **data):
         super().__init__(**data)
 
+    def model_post_init(self, __context) -> None:
+        """Cache the hash key, since the name and country are fixed once the vehicle is loaded."""
+        self._hash = hash((self.name.lower(), self.country.value.lower()))
+
     # Magic Methods
 
     def __str__(self) -> str:
@@ -30,7 +40,7 @@ class Vehicle(SerializableModel):
 
     def __hash__(self) -> int:
         """Generate a hash based on the vehicle's name and country."""
-        return hash((self.name.lower(), self.country.value.lower()))
+        return self._hash
 
     # Pydantic De/Serialization
 
@@ -39,10 +49,10 @@ class Vehicle(SerializableModel):
     def validate_country(cls, v: Union[str, Country]) -> Country:
         """Convert string country values to Country enum."""
         if isinstance(v, str):
-            for country_enum in Country:
-                if country_enum.value == v:
-                    return country_enum
-            raise ValueError(f"Invalid country: {v}")
+            country = _COUNTRY_BY_VALUE.get(v)
+            if country is None:
+                raise ValueError(f"Invalid country: {v}")
+            return country
         return v
 
     @field_serializer("country")
@@ -56,10 +66,10 @@ class Vehicle(SerializableModel):
     def validate_vehicle_type(cls, v: Union[str, VehicleType, None]) -> Optional[VehicleType]:
         """Convert string vehicle type values to VehicleType enum."""
         if isinstance(v, str):
-            for vehicle_type_enum in VehicleType:
-                if vehicle_type_enum.value == v:
-                    return vehicle_type_enum
-            raise ValueError(f"Invalid vehicle type: {v}")
+            vehicle_type = _VEHICLE_TYPE_BY_VALUE.get(v)
+            if vehicle_type is None:
+                raise ValueError(f"Invalid vehicle type: {v}")
+            return vehicle_type
         return v
 
     @field_serializer("vehicle_type")
@@ -72,10 +82,7 @@ class Vehicle(SerializableModel):
 
     def save_to_file(self, directory: Path) -> Path:
         """Save the battle to a JSON file in the specified directory."""
-        filename = f"{self.__str__().replace(' ', '_')}.json"
+        filename = f"{self.name.replace(' ', '_')}_({self.country.value}).json"
         file_path = directory / filename
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(self.to_json())
-
-        return file_path
+        return self.write_to_file(file_path)
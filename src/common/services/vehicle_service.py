@@ -6,7 +6,7 @@ logger = logging.getLogger(__name__)
 import json
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 from datetime import datetime
 
 from src.common.configuration import VehicleServiceConfig, KwargConfiguration
@@ -241,10 +241,10 @@ class VehicleService(KwargConfiguration[VehicleServiceConfig]):
         return matches
 
     def is_vehicle_premium(
-        self, vehicle_internal_names: list[str], *, search_datetime: Optional[datetime] = None
+        self, vehicle_internal_names: Sequence[str], *, search_datetime: Optional[datetime] = None
     ) -> bool:
         """
-        Check if any vehicle in a list of vehicles is premium.
+        Check if any of the given vehicles (by internal name) is premium.
         """
 
         for internal_name in vehicle_internal_names:
@@ -3,7 +3,9 @@ import logging
 logger = logging.getLogger(__name__)
 
 import argparse
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from src.replay_data_grabber.services.replay_manager_service import ReplayManagerService
@@ -21,15 +23,19 @@ class WarthogReplayDataCopier:
     # Lifecycle
 
     def __init__(
-        self, replay_manager_service: ReplayManagerService, *, output_dir: Path, allow_overwrite: bool = False
+        self,
+        replay_manager_service: ReplayManagerService,
+        *,
+        output_dir: Path,
+        allow_overwrite: bool = False,
+        max_workers: int = 8,
     ):
         self._replay_manager_service = replay_manager_service
         self._output_dir = output_dir
         self._allow_overwrite = allow_overwrite
+        self._max_workers = max_workers
 
-        if not self._output_dir.exists():
-            logger.info(f"Output directory {self._output_dir} does not exist. Creating it.")
-            self._output_dir.mkdir(parents=True, exist_ok=True)
+        self._output_dir.mkdir(parents=True, exist_ok=True)
 
     # Methods
 
@@ -40,26 +46,46 @@ class WarthogReplayDataCopier:
 
         replay_files = self._replay_manager_service.discover_raw_replay_files()
 
+        # Names already in the output directory
+        with os.scandir(self._output_dir) as entries:
+            existing_files = {entry.name for entry in entries}
+
         duplicate_files = []
-        copied_files = []
+        pending_files = []
         for replay_file in replay_files:
-            destination_path = self._output_dir / replay_file.name
-
-            if destination_path.exists() and not self._allow_overwrite:
+            if replay_file.name in existing_files and not self._allow_overwrite:
                 duplicate_files.append(replay_file.name)
                 continue
 
-            try:
-                shutil.copy2(replay_file, destination_path)
-                copied_files.append(replay_file.name)
-                logger.info(f"Copied {replay_file.name} to {destination_path}")
-            except OSError as e:
-                logger.error(f"Failed to copy {replay_file} to {destination_path}: {e}")
+            pending_files.append(replay_file)
+
+        # Copying is I/O bound, so copy in a thread pool
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            copied_files = [
+                replay_file.name
+                for replay_file, copied in zip(pending_files, executor.map(self._copy_replay, pending_files))
+                if copied
+            ]
 
         logger.info(f"Copied {len(copied_files)} replay files to {self._output_dir}")
         if duplicate_files:
             logger.info(f"Skipped {len(duplicate_files)} duplicate replay files.")
 
+    def _copy_replay(self, replay_file: Path) -> bool:
+        """
+        Copies a single replay file into the output directory, returning whether the copy succeeded.
+        """
+
+        destination_path = self._output_dir / replay_file.name
+
+        try:
+            shutil.copy2(replay_file, destination_path)
+            logger.info(f"Copied {replay_file.name} to {destination_path}")
+            return True
+        except OSError as e:
+            logger.error(f"Failed to copy {replay_file} to {destination_path}: {e}")
+            return False
+
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -11,13 +11,7 @@ BATTLE_RATING_TIER_COLORS = {
 }
 
 # Define Plotly specific configurations
-PLOTLY_BATTLE_RATING_TIER_STATUS_COLORS = {
-    BattleRatingTier.DOWNTIER: BATTLE_RATING_TIER_COLORS[BattleRatingTier.DOWNTIER]["hex"],
-    BattleRatingTier.PARTIAL_DOWNTIER: BATTLE_RATING_TIER_COLORS[BattleRatingTier.PARTIAL_DOWNTIER]["hex"],
-    BattleRatingTier.BALANCED: BATTLE_RATING_TIER_COLORS[BattleRatingTier.BALANCED]["hex"],
-    BattleRatingTier.PARTIAL_UPTIER: BATTLE_RATING_TIER_COLORS[BattleRatingTier.PARTIAL_UPTIER]["hex"],
-    BattleRatingTier.UPTIER: BATTLE_RATING_TIER_COLORS[BattleRatingTier.UPTIER]["hex"],
-}
+PLOTLY_BATTLE_RATING_TIER_STATUS_COLORS = {tier: colors["hex"] for tier, colors in BATTLE_RATING_TIER_COLORS.items()}
 
 PLOTLY_BATTLE_RATING_TIER_STATUS_ORDER = [
     BattleRatingTier.DOWNTIER,
@@ -26,18 +26,21 @@ def create_all_player_bar_score_distribution(
         print("No performance data available for plotting")
         return go.Figure()
 
-    df = global_performance_df.copy()
+    df = global_performance_df
 
     # --- Score bins ---------------------------------------------------------
+    # Pull the scores out once, all of the binning and statistics below work off of the same array
+    scores = df["player.score"].to_numpy()
+
     bin_width = 100
     min_score = 0
-    max_score = df["player.score"].max()
+    max_score = scores.max()
 
     bin_edges = list(range(int(min_score), int(max_score) + bin_width, bin_width))
     if len(bin_edges) < 2:
         bin_edges = [int(min_score), int(max_score) + 1]
 
-    hist_counts, _ = np.histogram(df["player.score"], bins=bin_edges)
+    hist_counts, _ = np.histogram(scores, bins=bin_edges)
     bin_centers = [(bin_edges[i] + bin_edges[i + 1]) / 2 for i in range(len(bin_edges) - 1)]
 
     # --- Figure -------------------------------------------------------------
@@ -59,9 +62,9 @@ def create_all_player_bar_score_distribution(
     )
 
     # --- Statistics lines ---------------------------------------------------
-    mean_score = df["player.score"].mean()
-    median_score = df["player.score"].median()
-    std_score = df["player.score"].std()
+    mean_score = scores.mean()
+    median_score = np.median(scores)
+    std_score = scores.std(ddof=1)  # Sample standard deviation, matching pandas
 
     fig.add_vline(
         x=mean_score,
@@ -93,8 +96,8 @@ def create_all_player_bar_score_distribution(
         f"Mean: {mean_score:.0f}<br>"
         f"Median: {median_score:.0f}<br>"
         f"Std Dev: {std_score:.0f}<br>"
-        f"Min: {df['player.score'].min()}<br>"
-        f"Max: {df['player.score'].max()}"
+        f"Min: {scores.min()}<br>"
+        f"Max: {max_score}"
     )
 
     fig.add_annotation(
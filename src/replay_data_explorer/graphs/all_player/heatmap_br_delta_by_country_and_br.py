@@ -19,8 +19,7 @@ def create_heatmap_br_delta_by_country_and_br(
         print("No performance data available for plotting")
         return None
 
-    # Get a copy of the data to avoid modifying the original
-    df = global_performance_df.copy()
+    df = global_performance_df
 
     # Get unique countries and battle ratings
     available_countries = sorted(df["player.country"].unique(), reverse=True)
@@ -31,7 +30,7 @@ def create_heatmap_br_delta_by_country_and_br(
         author_data = df[df["player.username"] == author_name]
         if not author_data.empty:
             author_max_br = author_data["player.battle_rating"].max()
-            available_brs = [br for br in available_brs if br <= author_max_br]
+            available_brs = available_brs[: np.searchsorted(available_brs, author_max_br, side="right")]
             # Also filter the dataframe to only include BRs up to author's max
             df = df[df["player.battle_rating"] <= author_max_br]
         else:
@@ -41,23 +40,22 @@ def create_heatmap_br_delta_by_country_and_br(
         print("Insufficient data for heatmap")
         return None
 
-    # Create a pivot table for mean BR delta with minimum instance threshold
-    heatmap_data = (
-        df.groupby(["player.country", "player.battle_rating"])["player.battle_rating_delta"]
-        .agg(["mean", "count"])
-        .reset_index()
+    # Create pivot tables for mean BR delta and battle count in a single pass
+    heatmap_data = df.pivot_table(
+        index="player.country",
+        columns="player.battle_rating",
+        values="player.battle_rating_delta",
+        aggfunc=["mean", "count"],
     )
 
-    # Filter out cells with insufficient data
-    heatmap_data = heatmap_data[heatmap_data["count"] >= MINIMUM_ITEMS_FOR_PLOTTING]
-
-    # Create pivot table for the heatmap
-    delta_pivot = heatmap_data.pivot(index="player.country", columns="player.battle_rating", values="mean")
-    count_pivot = heatmap_data.pivot(index="player.country", columns="player.battle_rating", values="count")
-
     # Fill NaN values with None for better visualization
-    delta_pivot = delta_pivot.reindex(index=available_countries, columns=available_brs)
-    count_pivot = count_pivot.reindex(index=available_countries, columns=available_brs).fillna(0)
+    delta_pivot = heatmap_data["mean"].reindex(index=available_countries, columns=available_brs)
+    count_pivot = heatmap_data["count"].reindex(index=available_countries, columns=available_brs).fillna(0)
+
+    # Filter out cells with insufficient data
+    sufficient_data = count_pivot >= MINIMUM_ITEMS_FOR_PLOTTING
+    delta_pivot = delta_pivot.where(sufficient_data)
+    count_pivot = count_pivot.where(sufficient_data, 0)
 
     # Prepare data for the heatmap
     z_values = delta_pivot.values
@@ -65,12 +63,13 @@ def create_heatmap_br_delta_by_country_and_br(
     y_values = available_countries
 
     # Create custom hover text with count information
+    tier_status_displays = battle_rating_tier_display_builder.get_battle_rating_tier_displays_from_deltas(z_values)
     hover_text = []
-    for i, country in enumerate(available_countries):
+    for country, delta_row, count_row, display_row in zip(
+        available_countries, z_values, count_pivot.values, tier_status_displays
+    ):
         row_text = []
-        for j, br in enumerate(available_brs):
-            delta = delta_pivot.iloc[i, j]
-            count = count_pivot.iloc[i, j]
+        for br, delta, count, tier_status_display in zip(available_brs, delta_row, count_row, display_row):
             if pd.isna(delta) or count < MINIMUM_ITEMS_FOR_PLOTTING:
                 row_text.append(
                     f"Country: {country}<br>"
@@ -78,9 +77,6 @@ def create_heatmap_br_delta_by_country_and_br(
                     + f"Insufficient data (< {MINIMUM_ITEMS_FOR_PLOTTING} players)"
                 )
             else:
-                tier_status_display = battle_rating_tier_display_builder.get_battle_rating_tier_display_from_delta(
-                    delta
-                )
                 row_text.append(
                     f"Country: {country}<br>"
                     + f"Battle Rating: {br:.1f}<br>"
@@ -110,8 +106,7 @@ def create_heatmap_br_delta_by_country_and_br(
     # Build the graph's title
     title_filters = OrderedDict()
     title_filters["Total Players"] = str(len(df))
-    unique_players = set(df["player.username"])
-    title_filters["Unique Players"] = str(len(unique_players))
+    title_filters["Unique Players"] = str(df["player.username"].nunique())
     if country_filters:
         title_filters[f"Countr{'y' if len(country_filters) == 1 else 'ies'}"] = ", ".join(
             [country.value for country in country_filters]
@@ -130,23 +125,22 @@ def create_heatmap_br_delta_by_country_and_br(
     )
 
     # Add text annotations showing mean BR delta (only for cells with sufficient data)
-    annotations = []
-    for i, country in enumerate(available_countries):
-        for j, br in enumerate(available_brs):
-            delta = delta_pivot.iloc[i, j]
-            count = count_pivot.iloc[i, j]
-            if not pd.isna(delta) and count >= MINIMUM_ITEMS_FOR_PLOTTING:
-                annotations.append(
-                    dict(
-                        x=j,  # Use index for proper centering
-                        y=i,  # Use index for proper centering
-                        text=f"{delta:.2f}",
-                        showarrow=False,
-                        font=dict(color="white", size=10),
-                        xanchor="center",  # Center horizontally
-                        yanchor="middle",  # Center vertically
-                    )
-                )
+    annotated_cells = ~np.isnan(z_values) & (count_pivot.values >= MINIMUM_ITEMS_FOR_PLOTTING)
+    annotated_rows, annotated_columns = np.nonzero(annotated_cells)
+    annotations = [
+        dict(
+            x=j,  # Use index for proper centering
+            y=i,  # Use index for proper centering
+            text=f"{delta:.2f}",
+            showarrow=False,
+            font=dict(color="white", size=10),
+            xanchor="center",  # Center horizontally
+            yanchor="middle",  # Center vertically
+        )
+        for i, j, delta in zip(
+            annotated_rows.tolist(), annotated_columns.tolist(), z_values[annotated_rows, annotated_columns]
+        )
+    ]
 
     fig.update_layout(annotations=annotations)
 
@@ -19,8 +19,7 @@ def create_heatmap_premium_score_delta_by_country_and_br(
         print("No performance data available for plotting")
         return None
 
-    # Get a copy of the data to avoid modifying the original
-    df = global_performance_df.copy()
+    df = global_performance_df
 
     # Get unique countries and battle ratings
     available_countries = sorted(df["player.country"].unique(), reverse=True)
@@ -32,7 +31,7 @@ def create_heatmap_premium_score_delta_by_country_and_br(
         author_data = df[author_mask]
         if len(author_data) > 0:
             author_max_br = author_data["player.battle_rating"].max()
-            available_brs = [br for br in available_brs if br <= author_max_br]
+            available_brs = available_brs[: np.searchsorted(available_brs, author_max_br, side="right")]
             # Also filter the dataframe to only include BRs up to author's max
             br_mask = df["player.battle_rating"] <= author_max_br
             df = df[br_mask]
@@ -43,69 +42,45 @@ def create_heatmap_premium_score_delta_by_country_and_br(
         print("Insufficient data for heatmap")
         return None
 
-    # Calculate mean scores for premium and non-premium players separately
-    # Split the data to avoid type inference issues
-    premium_mask = df["player.is_premium"] == True
-    premium_subset = df.loc[premium_mask]
-    premium_data = (
-        premium_subset.groupby(["player.country", "player.battle_rating"])["player.score"]
-        .agg(["mean", "count"])
-        .reset_index()
+    # Calculate mean scores for premium and non-premium players in a single pass
+    heatmap_data = df.pivot_table(
+        index=["player.country", "player.battle_rating"],
+        columns="player.is_premium",
+        values="player.score",
+        aggfunc=["mean", "count"],
     )
-    premium_data.columns = ["player.country", "player.battle_rating", "premium_mean", "premium_count"]
-
-    non_premium_mask = df["player.is_premium"] == False
-    non_premium_subset = df.loc[non_premium_mask]
-    non_premium_data = (
-        non_premium_subset.groupby(["player.country", "player.battle_rating"])["player.score"]
-        .agg(["mean", "count"])
-        .reset_index()
-    )
-    non_premium_data.columns = ["player.country", "player.battle_rating", "non_premium_mean", "non_premium_count"]
 
-    # Merge the data
-    heatmap_data = pd.merge(
-        premium_data, non_premium_data, on=["player.country", "player.battle_rating"], how="outer"
-    ).fillna(0)
+    # Ensure both premium and non-premium columns exist, and treat missing groups as empty (like an outer merge)
+    heatmap_data = heatmap_data.reindex(columns=pd.MultiIndex.from_product([["mean", "count"], [True, False]]))
+    heatmap_data.columns = ["premium_mean", "non_premium_mean", "premium_count", "non_premium_count"]
+    heatmap_data = heatmap_data.fillna(0).reset_index()
 
     # Calculate score delta (premium - non_premium) only where both have sufficient data
-    heatmap_data["premium_delta"] = None
     heatmap_data["total_count"] = heatmap_data["premium_count"] + heatmap_data["non_premium_count"]
 
-    # Only calculate delta where both premium and non-premium have sufficient data
+    # Only calculate delta where both premium and non-premium have sufficient data (NaN elsewhere, keeping floats)
     valid_mask = (heatmap_data["premium_count"] >= MINIMUM_ITEMS_FOR_PLOTTING) & (
         heatmap_data["non_premium_count"] >= MINIMUM_ITEMS_FOR_PLOTTING
     )
-    heatmap_data.loc[valid_mask, "premium_delta"] = (
-        heatmap_data.loc[valid_mask, "premium_mean"] - heatmap_data.loc[valid_mask, "non_premium_mean"]
+    heatmap_data["premium_delta"] = np.where(
+        valid_mask, heatmap_data["premium_mean"] - heatmap_data["non_premium_mean"], np.nan
     )
 
     # Filter out cells with insufficient total data
     heatmap_data = heatmap_data[heatmap_data["total_count"] >= MINIMUM_ITEMS_FOR_PLOTTING * 2]
 
-    # Create pivot tables for the heatmap
-    delta_pivot = heatmap_data.pivot(index="player.country", columns="player.battle_rating", values="premium_delta")
-    premium_count_pivot = heatmap_data.pivot(
-        index="player.country", columns="player.battle_rating", values="premium_count"
-    )
-    non_premium_count_pivot = heatmap_data.pivot(
-        index="player.country", columns="player.battle_rating", values="non_premium_count"
-    )
-    premium_mean_pivot = heatmap_data.pivot(
-        index="player.country", columns="player.battle_rating", values="premium_mean"
-    )
-    non_premium_mean_pivot = heatmap_data.pivot(
-        index="player.country", columns="player.battle_rating", values="non_premium_mean"
-    )
-
-    # Fill NaN values with None for better visualization
-    delta_pivot = delta_pivot.reindex(index=available_countries, columns=available_brs)
-    premium_count_pivot = premium_count_pivot.reindex(index=available_countries, columns=available_brs).fillna(0)
-    non_premium_count_pivot = non_premium_count_pivot.reindex(index=available_countries, columns=available_brs).fillna(
-        0
+    # Pivot every value column in one pass, aligned to the plotted countries and BRs, then slice out each grid
+    value_columns = ["premium_delta", "premium_count", "non_premium_count", "premium_mean", "non_premium_mean"]
+    heatmap_grid = (
+        heatmap_data.set_index(["player.country", "player.battle_rating"])[value_columns]
+        .unstack("player.battle_rating")
+        .reindex(index=available_countries, columns=pd.MultiIndex.from_product([value_columns, available_brs]))
     )
-    premium_mean_pivot = premium_mean_pivot.reindex(index=available_countries, columns=available_brs)
-    non_premium_mean_pivot = non_premium_mean_pivot.reindex(index=available_countries, columns=available_brs)
+    delta_pivot = heatmap_grid["premium_delta"]
+    premium_count_pivot = heatmap_grid["premium_count"].fillna(0)
+    non_premium_count_pivot = heatmap_grid["non_premium_count"].fillna(0)
+    premium_mean_pivot = heatmap_grid["premium_mean"]
+    non_premium_mean_pivot = heatmap_grid["non_premium_mean"]
 
     # Prepare data for the heatmap
     z_values = delta_pivot.values
@@ -113,15 +88,21 @@ def create_heatmap_premium_score_delta_by_country_and_br(
     y_values = available_countries
 
     # Create custom hover text with detailed information
+    deltas = z_values.tolist()
+    premium_counts = premium_count_pivot.values.tolist()
+    non_premium_counts = non_premium_count_pivot.values.tolist()
+    premium_means = premium_mean_pivot.values.tolist()
+    non_premium_means = non_premium_mean_pivot.values.tolist()
+
     hover_text = []
     for i, country in enumerate(available_countries):
         row_text = []
         for j, br in enumerate(available_brs):
-            delta = delta_pivot.iloc[i, j]
-            premium_count = premium_count_pivot.iloc[i, j]
-            non_premium_count = non_premium_count_pivot.iloc[i, j]
-            premium_mean = premium_mean_pivot.iloc[i, j]
-            non_premium_mean = non_premium_mean_pivot.iloc[i, j]
+            delta = deltas[i][j]
+            premium_count = premium_counts[i][j]
+            non_premium_count = non_premium_counts[i][j]
+            premium_mean = premium_means[i][j]
+            non_premium_mean = non_premium_means[i][j]
 
             if (
                 pd.isna(delta)
@@ -162,9 +143,10 @@ def create_heatmap_premium_score_delta_by_country_and_br(
 
     # Build the graph's title
     title_filters = OrderedDict()
+    premium_player_count = int(df["player.is_premium"].sum())
     title_filters["Total Players"] = str(len(df))
-    title_filters["Premium Players"] = str(len(df[df["player.is_premium"] == True]))
-    title_filters["Non-Premium Players"] = str(len(df[df["player.is_premium"] == False]))
+    title_filters["Premium Players"] = str(premium_player_count)
+    title_filters["Non-Premium Players"] = str(len(df) - premium_player_count)
     if country_filters:
         title_filters[f"Countr{'y' if len(country_filters) == 1 else 'ies'}"] = ", ".join(
             [country.value for country in country_filters]
@@ -185,29 +167,26 @@ def create_heatmap_premium_score_delta_by_country_and_br(
     )
 
     # Add text annotations showing score delta (only for cells with sufficient data)
-    annotations = []
-    for i, country in enumerate(available_countries):
-        for j, br in enumerate(available_brs):
-            delta = delta_pivot.iloc[i, j]
-            premium_count = premium_count_pivot.iloc[i, j]
-            non_premium_count = non_premium_count_pivot.iloc[i, j]
-
-            if (
-                not pd.isna(delta)
-                and premium_count >= MINIMUM_ITEMS_FOR_PLOTTING
-                and non_premium_count >= MINIMUM_ITEMS_FOR_PLOTTING
-            ):
-                annotations.append(
-                    dict(
-                        x=j,  # Use index for proper centering
-                        y=i,  # Use index for proper centering
-                        text=f"{delta:.0f}",
-                        showarrow=False,
-                        font=dict(color="white", size=10),
-                        xanchor="center",  # Center horizontally
-                        yanchor="middle",  # Center vertically
-                    )
-                )
+    annotated_cells = (
+        ~np.isnan(z_values)
+        & (premium_count_pivot.values >= MINIMUM_ITEMS_FOR_PLOTTING)
+        & (non_premium_count_pivot.values >= MINIMUM_ITEMS_FOR_PLOTTING)
+    )
+    annotated_rows, annotated_columns = np.nonzero(annotated_cells)
+    annotations = [
+        dict(
+            x=j,  # Use index for proper centering
+            y=i,  # Use index for proper centering
+            text=f"{delta:.0f}",
+            showarrow=False,
+            font=dict(color="white", size=10),
+            xanchor="center",  # Center horizontally
+            yanchor="middle",  # Center vertically
+        )
+        for i, j, delta in zip(
+            annotated_rows.tolist(), annotated_columns.tolist(), z_values[annotated_rows, annotated_columns]
+        )
+    ]
 
     fig.update_layout(annotations=annotations)
 
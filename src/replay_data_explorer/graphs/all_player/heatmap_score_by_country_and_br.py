@@ -32,7 +32,7 @@ def create_heatmap_score_by_country_and_br(
         author_data = df[author_mask]
         if len(author_data) > 0:
             author_max_br = author_data["player.battle_rating"].max()
-            available_brs = [br for br in available_brs if br <= author_max_br]
+            available_brs = available_brs[: np.searchsorted(available_brs, author_max_br, side="right")]
             # Also filter the dataframe to only include BRs up to author's max
             br_mask = df["player.battle_rating"] <= author_max_br
             df = df[br_mask]
@@ -103,8 +103,7 @@ def create_heatmap_score_by_country_and_br(
     # Build the graph's title
     title_filters = OrderedDict()
     title_filters["Total Players"] = len(df)
-    unique_players = set(df["player.username"])
-    title_filters["Unique Players"] = len(unique_players)
+    title_filters["Unique Players"] = df["player.username"].nunique()
     if country_filters:
         title_filters[f"Countr{'y' if len(country_filters) == 1 else 'ies'}"] = ", ".join(
             [country.value for country in country_filters]
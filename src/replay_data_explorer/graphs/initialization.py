@@ -44,3 +44,8 @@ battle_rating_tier_display_builder = BattleRatingTierDisplayBuilder()
 data_filterer = DataFilterer()
 data_loaders = DataLoaders(replay_manager_service)
 title_builder = TitleBuilder()
+
+# Graph functions are bound by pandas dispatch and memory traffic rather than arithmetic, so when writing them:
+# - Don't copy the input DataFrame unless the function actually writes to it (filtering already returns a new frame)
+# - Pull columns and pivots out as NumPy arrays (or lists) before looping over them in Python, instead of per-cell iloc
+# - Build hover text and annotations from those arrays and vectorized masks, rather than by re-filtering the frame
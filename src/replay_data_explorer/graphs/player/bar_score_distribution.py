@@ -20,9 +20,12 @@ def create_bar_score_distribution(player_performance_df: pd.DataFrame, *, player
     # Get a copy of the data to avoid modifying the original
     df = player_performance_df.copy()
 
+    # Pull the scores out once, all of the binning and statistics below work off of the same array
+    scores = df["player.score"].to_numpy()
+
     # Create score bins
     min_score = 0
-    max_score = df["player.score"].max()
+    max_score = scores.max()
     bin_width = 100  # Steps of 100 score
 
     # Create bin edges
@@ -46,16 +49,29 @@ def create_bar_score_distribution(player_performance_df: pd.DataFrame, *, player
         "left": "neutral",  # Left -> gray
     }
 
+    # Create bin centers for x-axis
+    bin_centers = [(bin_edges[i] + bin_edges[i + 1]) / 2 for i in range(len(bin_edges) - 1)]
+
+    # The bins are uniform, so bin every score once up front and just count per status. Like np.histogram, scores on
+    # the final edge belong to the last bin, and scores outside of the edges aren't counted.
+    statuses = df["status"].to_numpy()
+    scores_in_range = (scores >= bin_edges[0]) & (scores <= bin_edges[-1])
+    bin_indices = np.minimum((scores - bin_edges[0]) // bin_width, len(bin_centers) - 1).astype(np.intp)
+
+    # Count each status once, both to skip missing statuses and for the statistics text below
+    status_counts = df["status"].value_counts()
+
+    # Everything but the status name in the hover text is shared between the bars
+    hover_template_suffix = "Score Range: %{x:.0f}±" + f"{bin_width//2}<br>" + "Count: %{y}<extra></extra>"
+
     # Add stacked bars for each status
     for status in status_order:
-        status_data = df[df["status"] == status]
-        if not status_data.empty:
-            hist_counts, _ = np.histogram(status_data["player.score"], bins=bin_edges)
-
-            # Create bin centers for x-axis
-            bin_centers = [(bin_edges[i] + bin_edges[i + 1]) / 2 for i in range(len(bin_edges) - 1)]
+        if status in status_counts:
+            status_mask = statuses == status
+            hist_counts = np.bincount(bin_indices[status_mask & scores_in_range], minlength=len(bin_centers))
 
-            # Get the appropriate color
+            # Get the appropriate display name and color
+            status_name = status_mapping.get(status, status.title())
             color_key = status_color_mapping.get(status, "neutral")
             color = PLOTLY_CONCLUSION_COLORS.get(color_key, "#888888")
 
@@ -63,20 +79,17 @@ def create_bar_score_distribution(player_performance_df: pd.DataFrame, *, player
                 go.Bar(
                     x=bin_centers,
                     y=hist_counts,
-                    name=status_mapping.get(status, status.title()),
+                    name=status_name,
                     marker=dict(color=color, opacity=0.8, line=dict(color="white", width=1)),
                     width=bin_width * 0.8,
-                    hovertemplate=f"<b>{status_mapping.get(status, status.title())}</b><br>"
-                    + "Score Range: %{x:.0f}±"
-                    + f"{bin_width//2}<br>"
-                    + "Count: %{y}<extra></extra>",
+                    hovertemplate=f"<b>{status_name}</b><br>" + hover_template_suffix,
                 )
             )
 
     # Calculate overall statistics
-    mean_score = df["player.score"].mean()
-    median_score = df["player.score"].median()
-    std_score = df["player.score"].std()
+    mean_score = scores.mean()
+    median_score = np.median(scores)
+    std_score = scores.std(ddof=1)  # Sample standard deviation, matching pandas
 
     # Determine annotation positions to avoid overlap
     # If mean and median are close (within 5% of the range), offset them
@@ -118,14 +131,12 @@ def create_bar_score_distribution(player_performance_df: pd.DataFrame, *, player
         f"Mean: {mean_score:.0f}<br>"
         f"Median: {median_score:.0f}<br>"
         f"Std Dev: {std_score:.0f}<br>"
-        f"Min: {df['player.score'].min()}<br>"
-        f"Max: {df['player.score'].max()}<br><br>"
+        f"Min: {scores.min()}<br>"
+        f"Max: {max_score}<br><br>"
         f"<b>Battle Outcomes:</b><br>"
     )
 
-    # Calculate status counts for statistics (show in logical order)
-    status_counts = df["status"].value_counts()
-
+    # Add status counts to the statistics (show in logical order)
     for status in reversed(status_order):
         if status in status_counts:
             status_name = status_mapping.get(status, status.title())
@@ -31,32 +31,33 @@ def create_bar_score_vs_common_squadmates(
         print("No performance data available for plotting")
         return None
 
-    # Get a copy of the data to avoid modifying the original
-    df = global_performance_df.copy()
-
-    # Filter for the author's data
-    author_df = df[df["player.username"] == player_name].copy()
+    # Filter for the author's data, keeping the mask around so the squad lookup doesn't have to rescan usernames
+    is_author = global_performance_df["player.username"] == player_name
+    author_df = global_performance_df[is_author]
 
     if author_df.empty:
         print(f"No data available for player {player_name}")
         return None
 
+    # Find who the author squadded with in each of their battles, which everything below is derived from
+    author_squad_sessions = _get_author_squad_sessions(global_performance_df, author_df, is_author)
+
     # Find common squadmates
-    common_squadmates = _identify_common_squadmates(df, player_name, min_battles_threshold)
+    common_squadmates = _identify_common_squadmates(author_squad_sessions, min_battles_threshold)
 
     if not common_squadmates:
         print(f"No common squadmates found for {player_name} (min {min_battles_threshold} battles together)")
         return None
 
     # Calculate scores for different squadmate combinations
-    squadmate_scores = _calculate_squadmate_combination_scores(df, player_name, common_squadmates)
+    squadmate_scores = _calculate_squadmate_combination_scores(author_squad_sessions, common_squadmates)
 
     if not squadmate_scores:
         print("No squadmate combination data available")
         return None
 
     # Calculate aggregated scores for any squad with each individual squadmate
-    aggregated_scores = _calculate_aggregated_squadmate_scores(df, player_name, common_squadmates)
+    aggregated_scores = _calculate_aggregated_squadmate_scores(author_squad_sessions, common_squadmates)
 
     # Sort by mean score for better visualization
     squadmate_scores_sorted = sorted(squadmate_scores, key=lambda x: x["mean_score"])
@@ -174,118 +175,100 @@ def create_bar_score_vs_common_squadmates(
     return fig
 
 
-def _identify_common_squadmates(df: pd.DataFrame, player_name: str, min_battles_threshold: int) -> set:
+def _get_author_squad_sessions(df: pd.DataFrame, author_df: pd.DataFrame, is_author: pd.Series) -> pd.DataFrame:
     """
-    Identify squadmates who frequently play with the author.
+    Get the author's score and squadmates for each of their battles.
 
     Args:
         df: Global performance DataFrame
-        player_name: Author's username
-        min_battles_threshold: Minimum number of battles together to be considered common
+        author_df: The author's rows from df
+        is_author: Boolean mask of the author's rows in df
 
     Returns:
-        Set of common squadmate usernames
+        DataFrame with one row per author battle, containing the author's "player.score" and a "squadmates" tuple of the
+        other players in their squad (empty when the author was auto-squadded or not in a squad)
     """
-    # Track squadmate co-occurrences
-    squadmate_counts = Counter()
-
-    # Get all sessions where the author participated
-    author_sessions = df.loc[
-        df["player.username"] == player_name, ["session_id", "player.team", "player.squad", "player.auto_squad"]
-    ].copy()
-
-    # For each session the author participated in
-    for _, author_row in author_sessions.iterrows():
-        session_id = author_row["session_id"]
-        author_team = author_row["player.team"]
-        author_squad = author_row["player.squad"]
-        author_auto_squad = author_row["player.auto_squad"]
-
-        # Skip if author was auto-squadded or not in a squad
-        if author_auto_squad or pd.isna(author_squad) or author_squad == "":
-            continue
+    squad_keys = ["session_id", "player.team", "player.squad"]
+
+    author_sessions = author_df[squad_keys + ["player.score", "player.auto_squad"]].reset_index(drop=True)
+
+    # Get the squads the author actually played in (skipping auto-squads and battles without a squad). Rows with no
+    # team are skipped too, since they'd never match anyone, but merge would pair up their missing values.
+    author_squads = (
+        author_sessions.loc[
+            ~author_sessions["player.auto_squad"].astype(bool)
+            & author_sessions["player.team"].notna()
+            & author_sessions["player.squad"].notna()
+            & (author_sessions["player.squad"] != ""),
+            squad_keys,
+        ]
+        .rename_axis("author_session")
+        .reset_index()
+    )
 
-        # Find other players in the same squad in this session
-        squad_mask = (
-            (df["session_id"] == session_id)
-            & (df["player.team"] == author_team)
-            & (df["player.squad"] == author_squad)
-            & (df["player.username"] != player_name)
-        )
-        squad_members = df.loc[squad_mask, "player.username"].unique()
+    # Join every other player onto the author's squads in one pass, keeping each squadmate once per battle
+    squad_members = df.loc[~is_author, squad_keys + ["player.username"]].drop_duplicates()
+    squadmates = squad_members.merge(author_squads, on=squad_keys)
+    squadmates_by_session = squadmates.groupby("author_session")["player.username"].agg(tuple).to_dict()
+
+    return pd.DataFrame(
+        {
+            "player.score": author_sessions["player.score"],
+            "squadmates": [squadmates_by_session.get(session, ()) for session in author_sessions.index],
+        }
+    )
+
+
+def _identify_common_squadmates(author_squad_sessions: pd.DataFrame, min_battles_threshold: int) -> set:
+    """
+    Identify squadmates who frequently play with the author.
 
-        # Count co-occurrences
-        for squadmate in squad_members:
-            squadmate_counts[squadmate] += 1
+    Args:
+        author_squad_sessions: The author's battles, as returned by _get_author_squad_sessions
+        min_battles_threshold: Minimum number of battles together to be considered common
+
+    Returns:
+        Set of common squadmate usernames
+    """
+    # Track squadmate co-occurrences (battles without squadmates explode to NaN, which value_counts skips)
+    squadmate_counts = author_squad_sessions["squadmates"].explode().value_counts()
 
     # Filter to only squadmates with minimum threshold
-    common_squadmates = {squadmate for squadmate, count in squadmate_counts.items() if count >= min_battles_threshold}
+    common_squadmates = set(squadmate_counts.index[squadmate_counts >= min_battles_threshold])
 
     return common_squadmates
 
 
-def _calculate_squadmate_combination_scores(df: pd.DataFrame, player_name: str, common_squadmates: set) -> list[dict]:
+def _calculate_squadmate_combination_scores(author_squad_sessions: pd.DataFrame, common_squadmates: set) -> list[dict]:
     """
     Calculate mean scores for different squadmate combinations.
 
     Args:
-        df: Global performance DataFrame
-        player_name: Author's username
+        author_squad_sessions: The author's battles, as returned by _get_author_squad_sessions
         common_squadmates: Set of common squadmate usernames
 
     Returns:
         List of dictionaries with squadmate combination statistics
     """
-    # Track scores for each combination
-    combination_scores = defaultdict(list)
-
-    # Get all sessions where the author participated
-    author_sessions = df.loc[
-        df["player.username"] == player_name,
-        ["session_id", "player.team", "player.squad", "player.score", "player.auto_squad"],
-    ].copy()
-
-    # For each session the author participated in
-    for _, author_row in author_sessions.iterrows():
-        session_id = author_row["session_id"]
-        author_team = author_row["player.team"]
-        author_squad = author_row["player.squad"]
-        author_score = author_row["player.score"]
-        author_auto_squad = author_row["player.auto_squad"]
-
-        # Check if author was auto-squadded or not in a real squad
-        if author_auto_squad or pd.isna(author_squad) or author_squad == "":
-            # Solo / Auto-squad play
-            combination_scores[frozenset()].append(author_score)
+    # Key each battle by the common squadmates that were present. Solo play, auto-squads, and random squad ups with
+    # non-common players all end up as the empty combination.
+    combinations = pd.Series(
+        [
+            frozenset(squadmate for squadmate in squadmates if squadmate in common_squadmates)
+            for squadmates in author_squad_sessions["squadmates"]
+        ],
+        index=author_squad_sessions.index,
+        dtype=object,
+    )
 
-        else:
-            # Find other players in the same squad in this session
-            squad_mask = (
-                (df["session_id"] == session_id)
-                & (df["player.team"] == author_team)
-                & (df["player.squad"] == author_squad)
-                & (df["player.username"] != player_name)
-            )
-            squad_members = df.loc[squad_mask, "player.username"].unique()
-
-            # Filter to only common squadmates
-            common_members_in_squad = [m for m in squad_members if m in common_squadmates]
-
-            # If none of the squad members are in the common list, treat as solo
-            # (random squad up with non-common players)
-            if not common_members_in_squad:
-                combination_scores[frozenset()].append(author_score)
-            else:
-                # Create a frozenset of the common squadmates in this battle
-                combination = frozenset(common_members_in_squad)
-                combination_scores[combination].append(author_score)
-
-    # Calculate statistics for each combination
-    results = []
-    for combination, scores in combination_scores.items():
-        if not scores:
-            continue
+    # Calculate statistics for each combination in one grouped aggregation. The std dev is the population one (like
+    # np.std), so combinations with a single battle get 0.
+    grouped_scores = author_squad_sessions["player.score"].groupby(combinations, sort=False)
+    combination_stats = grouped_scores.agg(["mean", "count"])
+    combination_stats["std_dev"] = grouped_scores.std(ddof=0)
 
+    results = []
+    for combination, mean_score, battle_count, std_dev in combination_stats.itertuples():
         # Create a readable label
         if not combination:
             label = "Solo / Random Squad"
@@ -296,9 +279,9 @@ def _calculate_squadmate_combination_scores(df: pd.DataFrame, player_name: str,
         results.append(
             {
                 "label": label,
-                "mean_score": np.mean(scores),
-                "std_dev": np.std(scores) if len(scores) > 1 else 0.0,
-                "battle_count": len(scores),
+                "mean_score": mean_score,
+                "std_dev": std_dev,
+                "battle_count": battle_count,
                 "squadmates": combination,
             }
         )
@@ -306,7 +289,7 @@ def _calculate_squadmate_combination_scores(df: pd.DataFrame, player_name: str,
     return results
 
 
-def _calculate_aggregated_squadmate_scores(df: pd.DataFrame, player_name: str, common_squadmates: set) -> list[dict]:
+def _calculate_aggregated_squadmate_scores(author_squad_sessions: pd.DataFrame, common_squadmates: set) -> list[dict]:
     """
     Calculate mean scores when playing with each individual squadmate (in any combination).
 
@@ -314,8 +297,7 @@ def _calculate_aggregated_squadmate_scores(df: pd.DataFrame, player_name: str, c
     both are counted toward "Any squad with PlayerA".
 
     Args:
-        df: Global performance DataFrame
-        player_name: Author's username
+        author_squad_sessions: The author's battles, as returned by _get_author_squad_sessions
         common_squadmates: Set of common squadmate usernames
 
     Returns:
@@ -324,39 +306,11 @@ def _calculate_aggregated_squadmate_scores(df: pd.DataFrame, player_name: str, c
     # Track scores for each individual squadmate
     squadmate_scores = defaultdict(list)
 
-    # Get all sessions where the author participated
-    author_sessions = df.loc[
-        df["player.username"] == player_name,
-        ["session_id", "player.team", "player.squad", "player.score", "player.auto_squad"],
-    ].copy()
-
-    # For each session the author participated in
-    for _, author_row in author_sessions.iterrows():
-        session_id = author_row["session_id"]
-        author_team = author_row["player.team"]
-        author_squad = author_row["player.squad"]
-        author_score = author_row["player.score"]
-        author_auto_squad = author_row["player.auto_squad"]
-
-        # Skip auto-squad or no squad
-        if author_auto_squad or pd.isna(author_squad) or author_squad == "":
-            continue
-
-        # Find other players in the same squad in this session
-        squad_mask = (
-            (df["session_id"] == session_id)
-            & (df["player.team"] == author_team)
-            & (df["player.squad"] == author_squad)
-            & (df["player.username"] != player_name)
-        )
-        squad_members = df.loc[squad_mask, "player.username"].unique()
-
-        # Filter to only common squadmates
-        common_members_in_squad = [m for m in squad_members if m in common_squadmates]
-
-        # Add this score to each common squadmate who was present
-        for squadmate in common_members_in_squad:
-            squadmate_scores[squadmate].append(author_score)
+    # Add each battle's score to each common squadmate who was present
+    for author_score, squadmates in zip(author_squad_sessions["player.score"], author_squad_sessions["squadmates"]):
+        for squadmate in squadmates:
+            if squadmate in common_squadmates:
+                squadmate_scores[squadmate].append(author_score)
 
     # Calculate statistics for each squadmate
     results = []
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from src.replay_data_explorer.graphs.initialization import *
 
 
@@ -17,32 +19,23 @@ def create_bar_score_vs_map(player_performance_df: pd.DataFrame, *, player_name=
         print("No performance data available for plotting")
         return None
 
-    # Get a copy of the data to avoid modifying the original
-    df = player_performance_df.copy()
-
     # Get unique maps
-    available_maps = sorted(df["level"].unique())
+    available_maps = sorted(player_performance_df["level"].unique())
 
     if len(available_maps) == 0:
         print("Insufficient data for bar chart")
         return None
 
-    # Transform map names: remove "avg_" prefix, split on underscores, and capitalize
-    def transform_map_name(map_name):
-        # Remove "avg_" prefix if present
-        cleaned_name = map_name.replace("avg_", "", 1) if map_name.startswith("avg_") else map_name
-        # Split on underscores and capitalize each part
-        parts = cleaned_name.split("_")
-        # Minor formatting for conditions
-        if parts[-1] == "snow":
-            parts[-1] = f"({parts[-1]})"
-        return " ".join(part.capitalize() for part in parts)
-
-    # Apply transformation to map names
-    df["level_display"] = df["level"].apply(transform_map_name)
+    # Apply transformation to map names, only transforming each distinct map once and mapping the results onto the rows
+    level_displays = {map_name: _transform_map_name(map_name) for map_name in available_maps}
+    level_display = player_performance_df["level"].map(level_displays).rename("level_display")
 
     # Aggregate data by map to calculate mean scores and battle counts
-    map_stats = df.groupby(["level", "level_display"])["player.score"].agg(["mean", "count", "std"]).reset_index()
+    map_stats = (
+        player_performance_df.groupby(["level", level_display])["player.score"]
+        .agg(["mean", "count", "std"])
+        .reset_index()
+    )
     map_stats = map_stats.sort_values("mean", ascending=True)  # Sort by mean score for better visualization
 
     # Create the horizontal bar chart
@@ -65,8 +58,8 @@ def create_bar_score_vs_map(player_performance_df: pd.DataFrame, *, player_name=
     )
 
     # Calculate overall statistics
-    mean_score = df["player.score"].mean()
-    median_score = df["player.score"].median()
+    mean_score = player_performance_df["player.score"].mean()
+    median_score = player_performance_df["player.score"].median()
 
     # Determine annotation positions to avoid overlap
     if mean_score < median_score:
@@ -100,7 +93,7 @@ def create_bar_score_vs_map(player_performance_df: pd.DataFrame, *, player_name=
     title_filters = OrderedDict()
     if player_name:
         title_filters["Player"] = player_name
-    title_filters["Battles"] = len(df)
+    title_filters["Battles"] = len(player_performance_df)
     if country_filters:
         title_filters[f"Countr{'y' if len(country_filters) == 1 else 'ies'}"] = ", ".join(
             [country.value for country in country_filters]
@@ -131,3 +124,26 @@ def create_bar_score_vs_map(player_performance_df: pd.DataFrame, *, player_name=
     )
 
     return fig
+
+
+@lru_cache(maxsize=None)
+def _transform_map_name(map_name: str) -> str:
+    """
+    Transform a map name for display: remove the "avg_" prefix, split on underscores, and capitalize.
+
+    The set of maps is small, so results are cached for the life of the process.
+
+    Args:
+        map_name: Raw map (level) name from the replay
+
+    Returns:
+        Display name for the map
+    """
+    # Remove "avg_" prefix if present
+    cleaned_name = map_name.replace("avg_", "", 1) if map_name.startswith("avg_") else map_name
+    # Split on underscores and capitalize each part
+    parts = cleaned_name.split("_")
+    # Minor formatting for conditions
+    if parts[-1] == "snow":
+        parts[-1] = f"({parts[-1]})"
+    return " ".join(part.capitalize() for part in parts)
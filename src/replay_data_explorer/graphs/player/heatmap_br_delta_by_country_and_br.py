@@ -19,31 +19,25 @@ def create_heatmap_br_delta_by_country_and_br(
         print("No performance data available for plotting")
         return None
 
-    # Get a copy of the data to avoid modifying the original
-    df = player_performance_df.copy()
-
     # Get unique countries and battle ratings
-    available_countries = sorted(df["player.country"].unique(), reverse=True)
-    available_brs = sorted(df["player.battle_rating"].unique())
+    available_countries = sorted(player_performance_df["player.country"].unique(), reverse=True)
+    available_brs = sorted(player_performance_df["player.battle_rating"].unique())
 
     if len(available_countries) == 0 or len(available_brs) == 0:
         print("Insufficient data for heatmap")
         return None
 
-    # Create a pivot table for mean BR delta with minimum instance threshold
-    heatmap_data = (
-        df.groupby(["player.country", "player.battle_rating"])["player.battle_rating_delta"]
-        .agg(["mean", "count"])
-        .reset_index()
+    # Create pivot tables for mean BR delta and battle count in a single pass
+    heatmap_data = player_performance_df.pivot_table(
+        index="player.country",
+        columns="player.battle_rating",
+        values="player.battle_rating_delta",
+        aggfunc=["mean", "count"],
     )
 
-    # Create pivot table for the heatmap
-    delta_pivot = heatmap_data.pivot(index="player.country", columns="player.battle_rating", values="mean")
-    count_pivot = heatmap_data.pivot(index="player.country", columns="player.battle_rating", values="count")
-
     # Fill NaN values with None for better visualization
-    delta_pivot = delta_pivot.reindex(index=available_countries, columns=available_brs)
-    count_pivot = count_pivot.reindex(index=available_countries, columns=available_brs).fillna(0)
+    delta_pivot = heatmap_data["mean"].reindex(index=available_countries, columns=available_brs)
+    count_pivot = heatmap_data["count"].reindex(index=available_countries, columns=available_brs).fillna(0)
 
     # Prepare data for the heatmap
     z_values = delta_pivot.values
@@ -51,17 +45,16 @@ def create_heatmap_br_delta_by_country_and_br(
     y_values = available_countries
 
     # Create custom hover text with count information
+    tier_status_displays = battle_rating_tier_display_builder.get_battle_rating_tier_displays_from_deltas(z_values)
     hover_text = []
-    for i, country in enumerate(available_countries):
+    for country, delta_row, count_row, display_row in zip(
+        available_countries, z_values, count_pivot.values, tier_status_displays
+    ):
         row_text = []
-        for j, br in enumerate(available_brs):
-            delta = delta_pivot.iloc[i, j]
-            count = count_pivot.iloc[i, j]
+        for br, delta, count, tier_status in zip(available_brs, delta_row, count_row, display_row):
             if pd.isna(delta):
                 row_text.append(f"Country: {country}<br>" + f"Battle Rating: {br:.1f}<br>")
             else:
-                tier_status = battle_rating_tier_display_builder.get_battle_rating_tier_display_from_delta(delta)
-
                 hover_info = (
                     f"Country: {country}<br>"
                     f"Battle Rating: {br:.1f}<br>"
@@ -90,7 +83,7 @@ def create_heatmap_br_delta_by_country_and_br(
     title_filters = OrderedDict()
     if player_name:
         title_filters["Player"] = player_name
-    title_filters["Total Battles"] = str(len(df))
+    title_filters["Total Battles"] = str(len(player_performance_df))
     if country_filters:
         title_filters[f"Countr{'y' if len(country_filters) == 1 else 'ies'}"] = ", ".join(
             [country.value for country in country_filters]
@@ -109,23 +102,21 @@ def create_heatmap_br_delta_by_country_and_br(
     )
 
     # Add text annotations showing mean BR delta (only for cells with sufficient data)
-    annotations = []
-    for i, country in enumerate(available_countries):
-        for j, br in enumerate(available_brs):
-            delta = delta_pivot.iloc[i, j]
-            count = count_pivot.iloc[i, j]
-            if not pd.isna(delta):
-                annotations.append(
-                    dict(
-                        x=j,  # Use index for proper centering
-                        y=i,  # Use index for proper centering
-                        text=f"{delta:.3f}",
-                        showarrow=False,
-                        font=dict(color="white", size=10),
-                        xanchor="center",  # Center horizontally
-                        yanchor="middle",  # Center vertically
-                    )
-                )
+    annotated_rows, annotated_columns = np.nonzero(~np.isnan(z_values))
+    annotations = [
+        dict(
+            x=j,  # Use index for proper centering
+            y=i,  # Use index for proper centering
+            text=f"{delta:.3f}",
+            showarrow=False,
+            font=dict(color="white", size=10),
+            xanchor="center",  # Center horizontally
+            yanchor="middle",  # Center vertically
+        )
+        for i, j, delta in zip(
+            annotated_rows.tolist(), annotated_columns.tolist(), z_values[annotated_rows, annotated_columns]
+        )
+    ]
 
     fig.update_layout(annotations=annotations)
 
@@ -20,8 +20,14 @@ def create_scatter_score_vs_br(
         print("No performance data available for plotting")
         return None
 
-    # Get a copy of the data to avoid modifying the original
-    df = player_performance_df.copy()
+    # Remove outliers if specified. They only depend on the player's own score, so they're dropped before the team
+    # average lookups below.
+    df = player_performance_df
+    if std_dev is not None:
+        df = data_filterer.filter_outliers(df, "player.score", std_dev)
+
+    # Shallow copy for the team average column added below
+    df = df.copy(deep=False)
 
     # Load global performance data to calculate team averages
     global_df = data_loaders.get_global_performance_data(country_filters)
@@ -52,10 +58,6 @@ def create_scatter_score_vs_br(
     else:
         df["team_avg_score"] = df["player.score"]  # Fallback if no global data
 
-    # Remove outliers if specified
-    if std_dev is not None:
-        df = data_filterer.filter_outliers(df, "player.score", std_dev)
-
     outcome_symbols = PLOTLY_BATTLE_OUTCOME_SYMBOLS
     outcome_display_map = PLOTLY_BATTLE_OUTCOME_DISPLAY
     outcome_config = [
@@ -65,10 +67,13 @@ def create_scatter_score_vs_br(
     # Create the interactive scatter plot
     fig = go.Figure()
 
+    # Split the data by tier once, both the scatter traces and the trend lines below work off of these groups
+    tier_groups = dict(iter(df.groupby("player.tier_status", sort=False)))
+
     # One trace per tier — clicking a tier legend item filters all points of that tier.
     for tier_status in PLOTLY_BATTLE_RATING_TIER_STATUS_ORDER:
-        tier_data = df[df["player.tier_status"] == tier_status]
-        if tier_data.empty:
+        tier_data = tier_groups.get(tier_status)
+        if tier_data is None:
             continue
 
         tier_status_display = battle_rating_tier_display_builder.get_battle_rating_tier_display_from_battle_rating_tier(
@@ -79,16 +84,17 @@ def create_scatter_score_vs_br(
         symbols = tier_data["status"].map(outcome_symbols).fillna("circle").tolist()
         result_labels = tier_data["status"].map(outcome_display_map).fillna(tier_data["status"])
 
-        custom_data = pd.DataFrame(
-            {
-                "username": tier_data["player.username"],
-                "country": tier_data["player.country"],
-                "battle_rating": tier_data["battle_rating"],
-                "team_avg": tier_data["team_avg_score"],
-                "start_time": tier_data["start_time"],
-                "session_id": tier_data["session_id"],
-                "result": result_labels,
-            }
+        # Stack the hover columns straight into an object array (as object, so the numbers aren't coerced to strings)
+        custom_data = np.column_stack(
+            [
+                tier_data["player.username"].to_numpy(dtype=object),
+                tier_data["player.country"].to_numpy(dtype=object),
+                tier_data["battle_rating"].to_numpy(dtype=object),
+                tier_data["team_avg_score"].to_numpy(dtype=object),
+                tier_data["start_time"].to_numpy(dtype=object),
+                tier_data["session_id"].to_numpy(dtype=object),
+                result_labels.to_numpy(dtype=object),
+            ]
         )
 
         fig.add_trace(
@@ -104,7 +110,7 @@ def create_scatter_score_vs_br(
                     line=dict(width=1, color="white"),
                     opacity=0.7,
                 ),
-                customdata=custom_data.values,
+                customdata=custom_data,
                 hovertemplate=(
                     "<b>%{customdata[0]}</b><br>"
                     + "Country: %{customdata[1]}<br>"
@@ -136,14 +142,18 @@ def create_scatter_score_vs_br(
             )
         )
 
+    # Pull the fit inputs out once, the overall and per-tier trend lines all fit against these arrays
+    battle_ratings = df["player.battle_rating"].to_numpy()
+    scores = df["player.score"].to_numpy()
+
     # Add overall trend line
     if len(df) > 1:
         # Calculate overall trend line
-        z = np.polyfit(df["player.battle_rating"], df["player.score"], 1)
+        z = np.polyfit(battle_ratings, scores, 1)
         trend_line = np.poly1d(z)
 
         # Create trend line points
-        br_range = np.linspace(df["player.battle_rating"].min(), df["player.battle_rating"].max(), 100)
+        br_range = np.linspace(battle_ratings.min(), battle_ratings.max(), 100)
         trend_y = trend_line(br_range)
 
         fig.add_trace(
@@ -160,42 +170,37 @@ def create_scatter_score_vs_br(
 
     # Add per-tier trend lines
     for tier_status in PLOTLY_BATTLE_RATING_TIER_STATUS_ORDER:
-        tier_data = df[df["player.tier_status"] == tier_status]
+        tier_data = tier_groups.get(tier_status)
         tier_status_display = battle_rating_tier_display_builder.get_battle_rating_tier_display_from_battle_rating_tier(
             tier_status
         )
 
-        if len(tier_data) > 1:  # Need at least 2 points for a trend line
-            try:
-                # Calculate trend line for this tier
-                z_tier = np.polyfit(tier_data["player.battle_rating"], tier_data["player.score"], 1)
-                trend_line_tier = np.poly1d(z_tier)
-
-                # Create trend line points for this tier's BR range
-                tier_br_range = np.linspace(
-                    tier_data["player.battle_rating"].min(), tier_data["player.battle_rating"].max(), 50
-                )
-                tier_trend_y = trend_line_tier(tier_br_range)
-
-                # Use the same color as the tier but make it a solid line
-                tier_color = PLOTLY_BATTLE_RATING_TIER_STATUS_COLORS[tier_status]
-
-                fig.add_trace(
-                    go.Scatter(
-                        x=tier_br_range,
-                        y=tier_trend_y,
-                        mode="lines",
-                        name=f"{tier_status_display} Trend ({z_tier[0]:.1f})",
-                        line=dict(color=hex_to_rgba(tier_color, PLOTLY_TRENDLINE_OPACITY), width=1.5, dash="dot"),
-                        hovertemplate=f"{tier_status_display} Trend<br>BR: %{{x}}<br>Predicted Score: %{{y:.0f}}<extra></extra>",
-                        showlegend=True,
-                        legendgroup=tier_status_display,  # Group with the scatter points
-                        visible="legendonly",
-                    )
+        if tier_data is not None and len(tier_data) > 1:  # Need at least 2 points for a trend line
+            # Calculate trend line for this tier
+            tier_battle_ratings = tier_data["player.battle_rating"].to_numpy()
+            z_tier = np.polyfit(tier_battle_ratings, tier_data["player.score"].to_numpy(), 1)
+            trend_line_tier = np.poly1d(z_tier)
+
+            # Create trend line points for this tier's BR range
+            tier_br_range = np.linspace(tier_battle_ratings.min(), tier_battle_ratings.max(), 50)
+            tier_trend_y = trend_line_tier(tier_br_range)
+
+            # Use the same color as the tier but make it a solid line
+            tier_color = PLOTLY_BATTLE_RATING_TIER_STATUS_COLORS[tier_status]
+
+            fig.add_trace(
+                go.Scatter(
+                    x=tier_br_range,
+                    y=tier_trend_y,
+                    mode="lines",
+                    name=f"{tier_status_display} Trend ({z_tier[0]:.1f})",
+                    line=dict(color=hex_to_rgba(tier_color, PLOTLY_TRENDLINE_OPACITY), width=1.5, dash="dot"),
+                    hovertemplate=f"{tier_status_display} Trend<br>BR: %{{x}}<br>Predicted Score: %{{y:.0f}}<extra></extra>",
+                    showlegend=True,
+                    legendgroup=tier_status_display,  # Group with the scatter points
+                    visible="legendonly",
                 )
-            except Exception as e:
-                print(f"Could not calculate trend line for {tier_status_display}: {e}")
-                continue
+            )
 
     # Build the graph's title
     title_filters = OrderedDict()
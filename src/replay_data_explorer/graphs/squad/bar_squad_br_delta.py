@@ -1,4 +1,4 @@
-from src.replay_data_explorer.graphs.squad.common.squad_flavor import add_squad_flavor_column, SquadFlavor
+from src.replay_data_explorer.graphs.squad.common.squad_flavor import get_player_squad_flavor_df, SQUAD_FLAVOR_ORDER
 from src.replay_data_explorer.graphs.initialization import *
 
 
@@ -20,27 +20,26 @@ def create_bar_squad_br_delta(
         print("No performance data available for plotting")
         return None
 
-    # Get a copy of the data to avoid modifying the original
-    df = global_performance_df.copy()
-
-    # Apply squad flavor determination with session-based grouping
-    df = add_squad_flavor_column(df)
-    df = df[df["player.username"] == player_name]
+    # Apply squad flavor determination with session-based grouping, only over the player's sessions
+    df = get_player_squad_flavor_df(global_performance_df, player_name)
 
     # Check if we have any data after filtering
     if df.empty:
         print(f"No data available for player {player_name}")
         return None
 
-    # Calculate average BR delta by squad flavor
-    squad_br_delta = df.groupby("squad_flavor").agg({"player.battle_rating_delta": ["mean", "count", "std"]}).round(3)
-
-    # Flatten column names
-    squad_br_delta.columns = ["avg_br_delta", "battle_count", "std_dev"]
+    # Calculate average BR delta by squad flavor (rounding for display is left to the graph's number formats)
+    squad_br_deltas = df.groupby("squad_flavor", sort=False)["player.battle_rating_delta"]
+    squad_br_delta = pd.DataFrame(
+        {
+            "avg_br_delta": squad_br_deltas.mean(),
+            "battle_count": squad_br_deltas.count(),
+            "std_dev": squad_br_deltas.std(),
+        }
+    )
 
     # Create ordered list of squad flavors for consistent display
-    squad_flavor_order = [flavor.value for flavor in SquadFlavor]
-    available_flavors = [flavor for flavor in squad_flavor_order if flavor in squad_br_delta.index]
+    available_flavors = [flavor for flavor in SQUAD_FLAVOR_ORDER if flavor in squad_br_delta.index]
 
     if not available_flavors:
         print("No squad flavors found in data")
@@ -100,22 +99,28 @@ def create_bar_squad_br_delta(
         showlegend=False,
     )
 
-    # Add battle count annotations inside bars at the bottom
-    for squad_flavor in available_flavors:
-        row = ordered_br_delta.loc[squad_flavor]
+    # Add battle count annotations inside bars at the bottom, setting them all on the layout at once
+    annotations = []
+    for squad_flavor, avg_br_delta, battle_count in zip(
+        available_flavors, ordered_br_delta["avg_br_delta"], ordered_br_delta["battle_count"]
+    ):
         # Position annotation at the bottom of the bar (closer to zero)
-        if row["avg_br_delta"] >= 0:
+        if avg_br_delta >= 0:
             y_position = 0.02  # Slightly above zero for positive bars
         else:
-            y_position = row["avg_br_delta"] + 0.02  # Near the bottom of negative bars
-
-        fig.add_annotation(
-            x=squad_flavor,
-            y=y_position,
-            text=f"{int(row['battle_count'])} battle{'s' if row['battle_count'] != 1 else ''}",
-            showarrow=False,
-            font=dict(size=10, color="white"),
-            xanchor="center",
+            y_position = avg_br_delta + 0.02  # Near the bottom of negative bars
+
+        annotations.append(
+            dict(
+                x=squad_flavor,
+                y=y_position,
+                text=f"{int(battle_count)} battle{'s' if battle_count != 1 else ''}",
+                showarrow=False,
+                font=dict(size=10, color="white"),
+                xanchor="center",
+            )
         )
 
+    fig.update_layout(annotations=annotations)
+
     return fig
@@ -1,4 +1,4 @@
-from src.replay_data_explorer.graphs.squad.common.squad_flavor import add_squad_flavor_column, SquadFlavor
+from src.replay_data_explorer.graphs.squad.common.squad_flavor import get_player_squad_flavor_df, SQUAD_FLAVOR_ORDER
 from src.replay_data_explorer.graphs.initialization import *
 
 
@@ -20,27 +20,22 @@ def create_bar_squad_performance(
         print("No performance data available for plotting")
         return None
 
-    # Get a copy of the data to avoid modifying the original
-    df = global_performance_df.copy()
-
-    # Apply squad flavor determination with session-based grouping
-    df = add_squad_flavor_column(df)
-    df = df[df["player.username"] == player_name]
+    # Apply squad flavor determination with session-based grouping, only over the player's sessions
+    df = get_player_squad_flavor_df(global_performance_df, player_name)
 
     # Check if we have any data after filtering
     if df.empty:
         print(f"No data available for player {player_name}")
         return None
 
-    # Calculate average score by squad flavor
-    squad_performance = df.groupby("squad_flavor").agg({"player.score": ["mean", "count", "std"]}).round(1)
-
-    # Flatten column names
-    squad_performance.columns = ["avg_score", "battle_count", "std_dev"]
+    # Calculate average score by squad flavor (rounding for display is left to the graph's number formats)
+    squad_scores = df.groupby("squad_flavor", sort=False)["player.score"]
+    squad_performance = pd.DataFrame(
+        {"avg_score": squad_scores.mean(), "battle_count": squad_scores.count(), "std_dev": squad_scores.std()}
+    )
 
     # Create ordered list of squad flavors for consistent display
-    squad_flavor_order = [flavor.value for flavor in SquadFlavor]
-    available_flavors = [flavor for flavor in squad_flavor_order if flavor in squad_performance.index]
+    available_flavors = [flavor for flavor in SQUAD_FLAVOR_ORDER if flavor in squad_performance.index]
 
     if not available_flavors:
         print("No squad flavors found in data")
@@ -96,16 +91,21 @@ def create_bar_squad_performance(
         showlegend=False,
     )
 
-    # Add battle count annotations
-    for squad_flavor in available_flavors:
-        row = ordered_performance.loc[squad_flavor]
-        fig.add_annotation(
+    # Add battle count annotations, setting them all on the layout at once
+    annotations = [
+        dict(
             x=squad_flavor,
-            y=row["avg_score"] - (row["avg_score"] * 0.05),  # Position slightly below top of bar
-            text=f"{int(row['battle_count'])} battle{'s' if row['battle_count'] != 1 else ''}",
+            y=avg_score - (avg_score * 0.05),  # Position slightly below top of bar
+            text=f"{int(battle_count)} battle{'s' if battle_count != 1 else ''}",
             showarrow=False,
             font=dict(size=10, color="white"),
             xanchor="center",
         )
+        for squad_flavor, avg_score, battle_count in zip(
+            available_flavors, ordered_performance["avg_score"], ordered_performance["battle_count"]
+        )
+    ]
+
+    fig.update_layout(annotations=annotations)
 
     return fig
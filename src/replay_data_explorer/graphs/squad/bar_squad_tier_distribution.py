@@ -1,4 +1,8 @@
-from src.replay_data_explorer.graphs.squad.common.squad_flavor import add_squad_flavor_column, SquadFlavor
+from src.replay_data_explorer.graphs.squad.common.squad_flavor import (
+    add_squad_flavor_column,
+    get_player_squad_flavor_df,
+    SQUAD_FLAVOR_ORDER,
+)
 from src.replay_data_explorer.graphs.initialization import *
 
 
@@ -20,31 +24,36 @@ def create_bar_squad_tier_distribution(
         print("No performance data available for plotting")
         return None
 
-    # Get a copy of the data to avoid modifying the original
-    df = global_performance_df.copy()
-
-    # Apply squad flavor determination with session-based grouping
-    df = add_squad_flavor_column(df)
-
-    # Filter for the specific player if provided
+    # Apply squad flavor determination with session-based grouping. When filtering for a specific player, only their
+    # sessions need to be grouped.
     if player_name:
-        df = df[df["player.username"] == player_name]
+        df = get_player_squad_flavor_df(global_performance_df, player_name)
+    else:
+        df = add_squad_flavor_column(global_performance_df)
+
+    if df.empty:
+        print("No data available after filtering")
+        return None
 
     # Get available squad types using enum order
-    squad_flavor_order = [flavor.value for flavor in SquadFlavor]
-    unique_flavors = pd.Series(df["squad_flavor"]).unique()
-    available_squad_types = [flavor for flavor in squad_flavor_order if flavor in unique_flavors]
+    unique_flavors = df["squad_flavor"].unique()
+    available_squad_types = [flavor for flavor in SQUAD_FLAVOR_ORDER if flavor in unique_flavors]
 
     if len(available_squad_types) == 0:
         print("No squad types found in data")
         return None
 
+    # Battle counts per squad type and tier status
+    squad_tier_counts = pd.crosstab(df["squad_flavor"], df["player.tier_status"]).reindex(
+        index=available_squad_types, fill_value=0
+    )
+    squad_type_totals = df["squad_flavor"].value_counts()
+
     # Calculate tier percentages for each squad type
     squad_tier_data = []
     for squad_type in available_squad_types:
-        squad_data = df[df["squad_flavor"] == squad_type]
-        tier_counts = pd.Series(squad_data["player.tier_status"]).value_counts()
-        total_battles = len(squad_data)
+        tier_counts = squad_tier_counts.loc[squad_type]
+        total_battles = squad_type_totals[squad_type]
 
         # Calculate percentages for each tier
         tier_percentages = {}
@@ -57,10 +66,8 @@ def create_bar_squad_tier_distribution(
             {"squad_type": squad_type, "tier_percentages": tier_percentages, "total_battles": total_battles}
         )
 
-    # Create the stacked bar chart
-    fig = go.Figure()
-
-    # Add a bar for each tier status
+    # Collect a bar for each tier status, and add them all to the stacked bar chart at once
+    traces = []
     for tier_status in reversed(PLOTLY_BATTLE_RATING_TIER_STATUS_ORDER):
         tier_status_display = battle_rating_tier_display_builder.get_battle_rating_tier_display_from_battle_rating_tier(
             tier_status
@@ -72,7 +79,7 @@ def create_bar_squad_tier_distribution(
 
         # Only add bars that have data
         if any(p > 0 for p in percentages):
-            fig.add_trace(
+            traces.append(
                 go.Bar(
                     name=tier_status_display,
                     x=squad_types,
@@ -93,6 +100,9 @@ def create_bar_squad_tier_distribution(
                 )
             )
 
+    # Create the stacked bar chart
+    fig = go.Figure(data=traces)
+
     # Build the graph's title
     title_filters = OrderedDict()
     if player_name and not display_player_name:
@@ -1,4 +1,8 @@
-from src.replay_data_explorer.graphs.squad.common.squad_flavor import add_squad_flavor_column, SquadFlavor
+from src.replay_data_explorer.graphs.squad.common.squad_flavor import (
+    add_squad_flavor_column,
+    get_player_squad_flavor_df,
+    SQUAD_FLAVOR_ORDER,
+)
 from src.replay_data_explorer.graphs.initialization import *
 
 
@@ -21,23 +25,19 @@ def create_bar_squad_win_rate(
         print("No data available for plotting")
         return None
 
-    # Get a copy of the data to avoid modifying the original
-    df = global_performance_df.copy()
-
-    # Apply squad flavor determination with session-based grouping
-    df = add_squad_flavor_column(df)
-
-    # Filter for the specific player if provided
+    # Apply squad flavor determination with session-based grouping. When filtering for a specific player, only their
+    # sessions need to be grouped.
     if player_name:
-        df = df[df["player.username"] == player_name]
+        df = get_player_squad_flavor_df(global_performance_df, player_name)
+    else:
+        df = add_squad_flavor_column(global_performance_df)
 
     if df.empty:
         print("No data available after filtering")
         return None
 
     # Get available squad types using enum order
-    squad_flavor_order = [flavor.value for flavor in SquadFlavor]
-    available_squad_types = [flavor for flavor in squad_flavor_order]
+    available_squad_types = list(SQUAD_FLAVOR_ORDER)
 
     if len(available_squad_types) == 0:
         print("No squad types found in data")
@@ -52,12 +52,17 @@ def create_bar_squad_win_rate(
     }
     status_names = {"left": "Left Early", "fail": "Loss", "success": "Victory"}
 
+    # Battle counts per squad type and battle outcome
+    squad_status_counts = pd.crosstab(df["squad_flavor"], df["status"]).reindex(
+        index=available_squad_types, fill_value=0
+    )
+    squad_type_totals = df["squad_flavor"].value_counts().reindex(available_squad_types, fill_value=0)
+
     # Calculate win rate percentages for each squad type
     squad_data = []
     for squad_type in available_squad_types:
-        squad_battles = df[df["squad_flavor"] == squad_type]
-        status_counts = pd.Series(squad_battles["status"]).value_counts()
-        total_battles = len(squad_battles)
+        status_counts = squad_status_counts.loc[squad_type]
+        total_battles = squad_type_totals[squad_type]
 
         # Calculate percentages for each status
         percentages = {}
@@ -68,10 +73,8 @@ def create_bar_squad_win_rate(
 
         squad_data.append({"squad_type": squad_type, "percentages": percentages, "total_battles": total_battles})
 
-    # Create the stacked bar chart
-    fig = go.Figure()
-
-    # Add a bar for each status
+    # Collect a bar for each status, and add them all to the stacked bar chart at once
+    traces = []
     for status in reversed(status_order):  # Reverse to stack correctly
         status_name = status_names[status]
 
@@ -82,7 +85,7 @@ def create_bar_squad_win_rate(
 
         # Only add bars that have data
         if any(p > 0 for p in percentages):
-            fig.add_trace(
+            traces.append(
                 go.Bar(
                     name=status_name,
                     x=squad_types,
@@ -103,6 +106,9 @@ def create_bar_squad_win_rate(
                 )
             )
 
+    # Create the stacked bar chart
+    fig = go.Figure(data=traces)
+
     # Build the graph's title
     title_filters = OrderedDict()
     if player_name and not display_player_name:
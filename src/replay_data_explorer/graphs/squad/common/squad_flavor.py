@@ -1,5 +1,6 @@
 from enum import Enum
 
+import numpy as np
 import pandas as pd
 
 
@@ -10,6 +11,22 @@ class SquadFlavor(str, Enum):
     SQUAD_4 = "Squad of 4"
 
 
+# Squad flavor values in display order
+SQUAD_FLAVOR_ORDER = tuple(flavor.value for flavor in SquadFlavor)
+
+# Squad flavor for each squad size, indexed directly by the (capped) size
+_SQUAD_FLAVORS_BY_SIZE = np.array(
+    [
+        SquadFlavor.SOLO.value,
+        SquadFlavor.SOLO.value,
+        SquadFlavor.SQUAD_2.value,
+        SquadFlavor.SQUAD_3.value,
+        SquadFlavor.SQUAD_4.value,
+    ],
+    dtype=object,
+)
+
+
 def add_squad_flavor_column(global_performance_df: pd.DataFrame) -> pd.DataFrame:
     """
     Add a squad_flavor column to the DataFrame indicating the squad size for each player.
@@ -20,34 +37,58 @@ def add_squad_flavor_column(global_performance_df: pd.DataFrame) -> pd.DataFrame
     Returns:
         DataFrame with added squad_flavor column
     """
-    df = global_performance_df.copy()
+    df = global_performance_df
 
-    # Initialize squad_flavor column
-    df["squad_flavor"] = SquadFlavor.SOLO.value
+    # Initialize squad flavors, built up separately so the input frame is only read from
+    squad_flavors = np.full(len(df), SquadFlavor.SOLO.value, dtype=object)
 
-    # Handle players with valid squads (not auto-squad and not null/empty)
-    valid_squad_mask = df["player.squad"].notna() & (df["player.squad"] != "") & (~df["player.auto_squad"])
+    # Handle players with valid squads (not auto-squad and not null/empty). Players without a team can't be grouped
+    # into a squad, so they're left as solo.
+    valid_squad_mask = (
+        df["player.squad"].notna() & (df["player.squad"] != "") & (~df["player.auto_squad"]) & df["player.team"].notna()
+    )
 
     if valid_squad_mask.any():
-        # For each unique combination of session, team and squad, calculate squad size
-        squad_groups = df[valid_squad_mask].groupby(["session_id", "player.team", "player.squad"])
-
-        for group_key, group in squad_groups:
-            squad_size = len(group)
-            indices = group.index
-
-            if squad_size == 1:
-                squad_flavor = SquadFlavor.SOLO.value
-            elif squad_size == 2:
-                squad_flavor = SquadFlavor.SQUAD_2.value
-            elif squad_size == 3:
-                squad_flavor = SquadFlavor.SQUAD_3.value
-            elif squad_size == 4:
-                squad_flavor = SquadFlavor.SQUAD_4.value
-            else:
-                # For squads larger than 4, cap at SQUAD_4
-                squad_flavor = SquadFlavor.SQUAD_4.value
-
-            df.loc[indices, "squad_flavor"] = squad_flavor
+        # For each unique combination of session, team and squad, calculate squad size in a single grouped transform,
+        # then look each row's flavor up by its size
+        squad_sizes = (
+            df[valid_squad_mask]
+            .groupby(["session_id", "player.team", "player.squad"], sort=False)["player.username"]
+            .transform("size")
+        )
+
+        # For squads larger than 4, cap at SQUAD_4
+        squad_flavors[valid_squad_mask.to_numpy()] = _SQUAD_FLAVORS_BY_SIZE[squad_sizes.clip(upper=4).to_numpy()]
+
+    # Shallow copy for the new column
+    df = df.copy(deep=False)
+    df["squad_flavor"] = squad_flavors
 
     return df
+
+
+def get_player_squad_flavor_df(global_performance_df: pd.DataFrame, player_name: str) -> pd.DataFrame:
+    """
+    Get a specific player's rows from the DataFrame, with the squad_flavor column added.
+
+    Squad sizes only depend on the other players in the same session, so only the sessions the player took part in
+    are grouped, rather than every session in the DataFrame.
+
+    Args:
+        global_performance_df: DataFrame with player performance data
+        player_name: Name of the player to get the rows for
+
+    Returns:
+        DataFrame of the player's rows with added squad_flavor column
+    """
+    df = global_performance_df
+
+    is_player = df["player.username"] == player_name
+    if not is_player.any():
+        # The player isn't in the data, so skip scanning for their sessions and just flavor the (empty) selection
+        return add_squad_flavor_column(df[is_player])
+
+    player_sessions = df.loc[is_player, "session_id"].unique()
+    df = add_squad_flavor_column(df[df["session_id"].isin(player_sessions)])
+
+    return df[df["player.username"] == player_name]
@@ -20,22 +20,25 @@ def create_bar_tier_distribution(player_performance_df: pd.DataFrame, *, player_
     # Get a copy of the data to avoid modifying the original
     df = player_performance_df.copy()
 
-    # Normalize BR delta from -1 to 0 scale to -0.5 to +0.5 scale
-    df["player.battle_rating_delta_normalized"] = df["player.battle_rating_delta"] + 0.5
-    df["player.battle_rating_delta_normalized"] = df["player.battle_rating_delta_normalized"].clip(-0.5, 0.5)
+    # Normalize BR delta from -1 to 0 scale to -0.5 to +0.5 scale (clipping the shifted array in place)
+    battle_rating_deltas_normalized = df["player.battle_rating_delta"].to_numpy(dtype=float) + 0.5
+    np.clip(battle_rating_deltas_normalized, -0.5, 0.5, out=battle_rating_deltas_normalized)
+    df["player.battle_rating_delta_normalized"] = battle_rating_deltas_normalized
 
     # Ensure start_time is datetime type (in case it was serialized as string)
     if not pd.api.types.is_datetime64_any_dtype(df["start_time"]):
         df["start_time"] = pd.to_datetime(df["start_time"])
 
     # Extract date only (without time) for display
-    df["date"] = df["start_time"].dt.date
+    df["date"] = df["start_time"].dt.strftime("%Y-%m-%d")
 
-    # Sort by timestamp to show battles in chronological order
-    df = df.sort_values("start_time").reset_index(drop=True)
+    # Sort by timestamp to show battles in chronological order, skipping the sort when they already are
+    if not df["start_time"].is_monotonic_increasing:
+        df = df.sort_values("start_time")
+    df = df.reset_index(drop=True)
 
     # Create a sequential index for each battle (x-axis position)
-    df["battle_index"] = range(len(df))
+    df["battle_index"] = np.arange(len(df), dtype=np.int32)
 
     # Create subset of battle indices for x-axis labels to avoid cluttering
     # Show labels at regular intervals but not too many
@@ -46,66 +49,61 @@ def create_bar_tier_distribution(player_performance_df: pd.DataFrame, *, player_
     if label_indices[-1] != total_battles - 1 or label_indices[-1]:
         label_indices.append(total_battles - 1)
 
-    # Create tick labels showing dates for the selected battles
-    tickvals = [df.iloc[i]["battle_index"] for i in label_indices]
-    ticktext = [str(df.iloc[i]["date"]) for i in label_indices]
-
-    fig = go.Figure()
-
-    # Get unique countries for filtering
-    available_countries = sorted(df["player.country"].unique())
-
-    # Create individual bars for each battle, grouped by country for legend filtering
-    for country in available_countries:
-        country_data = df[df["player.country"] == country]
-        country_legend_created = False
-
-        if not country_data.empty:
-            # Create separate traces for each tier status within this country
-            for tier_status in PLOTLY_BATTLE_RATING_TIER_STATUS_ORDER:
-                tier_country_data = country_data[country_data["player.tier_status"] == tier_status]
-
-                if len(tier_country_data) > 0:
-                    tier_status_display = (
-                        battle_rating_tier_display_builder.get_battle_rating_tier_display_from_battle_rating_tier(
-                            tier_status
-                        )
-                    )
-
-                    # Use tier status color but make it distinguishable by country
-                    base_color = PLOTLY_BATTLE_RATING_TIER_STATUS_COLORS[tier_status]
-
-                    fig.add_trace(
-                        go.Bar(
-                            x=tier_country_data["battle_index"],  # Use sequential battle index for positioning
-                            y=tier_country_data["player.battle_rating_delta_normalized"],
-                            name=f"{country}",  # Group by country for legend filtering
-                            legendgroup=country,  # Group all tier statuses for this country
-                            marker=dict(color=base_color, line=dict(color=base_color, width=0.5)),
-                            width=0.5,  # Set consistent bar width
-                            customdata=np.column_stack(
-                                [
-                                    tier_country_data["player.country"],
-                                    tier_country_data["player.battle_rating_delta"],
-                                    [tier_status_display] * len(tier_country_data),
-                                    [str(date) for date in tier_country_data["date"]],
-                                    tier_country_data["start_time"],
-                                ]
-                            ),
-                            hovertemplate=(
-                                "<b>%{customdata[0]}</b><br>"
-                                + "Date: %{customdata[3]}<br>"
-                                + "Time: %{customdata[4]}<br>"
-                                + "BR Delta: %{customdata[1]:.2f}<br>"
-                                + "Normalized: %{y:.2f}<br>"
-                                + "Tier Status: %{customdata[2]}<br>"
-                                + "<extra></extra>"
-                            ),
-                            showlegend=country_legend_created == False,  # Only show legend for first tier status
-                        )
-                    )
-
-                    country_legend_created = True
+    # Create tick labels showing dates for the selected battles (battle indices are just row positions after the sort)
+    tickvals = label_indices
+    ticktext = df["date"].iloc[label_indices].tolist()
+
+    # Collect every bar trace first, and add them all to the figure at once
+    traces = []
+
+    # Get the display name for each tier status once, they're looked up per battle below
+    tier_status_displays = {
+        tier_status: battle_rating_tier_display_builder.get_battle_rating_tier_display_from_battle_rating_tier(
+            tier_status
+        )
+        for tier_status in PLOTLY_BATTLE_RATING_TIER_STATUS_ORDER
+    }
+
+    # Build the colors and hover data for every battle once, each country's trace just takes its rows from them (the
+    # index is the row position after the sort, so it can be used to slice these directly)
+    tier_colors = df["player.tier_status"].map(PLOTLY_BATTLE_RATING_TIER_STATUS_COLORS).to_numpy(dtype=object)
+    custom_data = np.column_stack(
+        [
+            df["player.country"],
+            df["player.battle_rating_delta"],
+            df["player.tier_status"].map(tier_status_displays),
+            df["date"],
+            df["start_time"],
+        ]
+    )
+
+    # One bar trace per country (for legend filtering), with each battle's bar colored by its tier status
+    for country, country_data in df.groupby("player.country"):
+        country_positions = country_data.index.to_numpy()
+        country_tier_colors = tier_colors[country_positions].tolist()
+
+        traces.append(
+            go.Bar(
+                x=country_data["battle_index"].to_numpy(),  # Use sequential battle index for positioning
+                y=country_data["player.battle_rating_delta_normalized"].to_numpy(),
+                name=f"{country}",  # Group by country for legend filtering
+                legendgroup=country,
+                marker=dict(color=country_tier_colors, line=dict(color=country_tier_colors, width=0.5)),
+                width=0.5,  # Set consistent bar width
+                customdata=custom_data[country_positions],
+                hovertemplate=(
+                    "<b>%{customdata[0]}</b><br>"
+                    + "Date: %{customdata[3]}<br>"
+                    + "Time: %{customdata[4]}<br>"
+                    + "BR Delta: %{customdata[1]:.2f}<br>"
+                    + "Normalized: %{y:.2f}<br>"
+                    + "Tier Status: %{customdata[2]}<br>"
+                    + "<extra></extra>"
+                ),
+            )
+        )
+
+    fig = go.Figure(data=traces)
 
     # Build the graph's title
     title_filters = OrderedDict()
@@ -17,27 +17,17 @@ def create_bar_tier_frequency_vs_br(player_performance_df: pd.DataFrame, *, play
         print("No performance data available for plotting")
         return None
 
-    # Get a copy of the data to avoid modifying the original
-    df = player_performance_df.copy()
-
-    # Get available battle ratings
-    available_brs = sorted(df["player.battle_rating"].unique())
-
-    # Calculate tier percentages for each battle rating
-    br_tier_data = []
-    for br in available_brs:
-        br_data = df[df["player.battle_rating"] == br]
-        tier_counts = pd.Series(br_data["player.tier_status"]).value_counts()
-        total_battles = len(br_data)
-
-        # Calculate percentages for each tier
-        tier_percentages = {}
-        for tier_status in PLOTLY_BATTLE_RATING_TIER_STATUS_ORDER:
-            count = tier_counts.get(tier_status) or 0
-            percentage = (count / total_battles) * 100 if total_battles > 0 else 0
-            tier_percentages[tier_status] = {"percentage": percentage, "count": count, "total": total_battles}
+    # Count each tier per battle rating in one pass. The totals come from the full counts, so they still include any
+    # tiers that aren't plotted.
+    tier_counts = pd.crosstab(
+        player_performance_df["player.battle_rating"], player_performance_df["player.tier_status"]
+    )
+    totals = tier_counts.sum(axis=1)
+    tier_counts = tier_counts.reindex(columns=PLOTLY_BATTLE_RATING_TIER_STATUS_ORDER, fill_value=0)
+    tier_percentages = tier_counts.div(totals, axis=0) * 100
 
-        br_tier_data.append({"battle_rating": br, "tier_percentages": tier_percentages, "total_battles": total_battles})
+    # Get available battle ratings (crosstab sorts them)
+    available_brs = tier_counts.index.tolist()
 
     # Create the stacked bar chart
     fig = go.Figure()
@@ -47,23 +37,21 @@ def create_bar_tier_frequency_vs_br(player_performance_df: pd.DataFrame, *, play
         tier_status_display = battle_rating_tier_display_builder.get_battle_rating_tier_display_from_battle_rating_tier(
             tier_status
         )
-        battle_ratings = [data["battle_rating"] for data in br_tier_data]
-        percentages = [data["tier_percentages"][tier_status]["percentage"] for data in br_tier_data]
-        counts = [data["tier_percentages"][tier_status]["count"] for data in br_tier_data]
-        totals = [data["total_battles"] for data in br_tier_data]
+        percentages = tier_percentages[tier_status].tolist()
+        counts = tier_counts[tier_status].tolist()
 
         # Only add bars that have data
         if any(p > 0 for p in percentages):
             fig.add_trace(
                 go.Bar(
                     name=tier_status_display,
-                    x=battle_ratings,
+                    x=available_brs,
                     y=percentages,
                     text=[str(count) if count > 0 else "" for count in counts],
                     textposition="inside",
                     textfont=dict(color="white", size=9),
                     marker_color=PLOTLY_BATTLE_RATING_TIER_STATUS_COLORS[tier_status],
-                    customdata=list(zip(counts, totals)),
+                    customdata=list(zip(counts, totals.tolist())),
                     hovertemplate=(
                         f"<b>{tier_status_display}</b><br>"
                         + "Battle Rating: %{x}<br>"
@@ -79,8 +67,7 @@ def create_bar_tier_frequency_vs_br(player_performance_df: pd.DataFrame, *, play
     title_filters = OrderedDict()
     if player_name:
         title_filters["Player"] = player_name
-    total_battles = sum(data["total_battles"] for data in br_tier_data)
-    title_filters["Battles"] = total_battles
+    title_filters["Battles"] = int(totals.sum())
     if country_filters:
         title_filters[f"Countr{'y' if len(country_filters) == 1 else 'ies'}"] = ", ".join(
             [country.value for country in country_filters]
@@ -17,33 +17,21 @@ def create_bar_tier_frequency_vs_country(player_performance_df: pd.DataFrame, *,
         print("No performance data available for plotting")
         return None
 
-    # Get a copy of the data to avoid modifying the original
-    df = player_performance_df.copy()
-
     # Get available countries and filter if specified
-    available_countries = list(df["player.country"].unique())
+    available_countries = list(player_performance_df["player.country"].unique())
     if country_filters:
         # Convert Country enum values to strings for comparison
-        country_filter_names = [country.value for country in country_filters]
+        country_filter_names = {country.value for country in country_filters}
         available_countries = [country for country in available_countries if country in country_filter_names]
 
-    # Calculate tier percentages for each country
-    country_tier_data = []
-    for country in sorted(available_countries):
-        country_data = df[df["player.country"] == country]
-        tier_counts = pd.Series(country_data["player.tier_status"]).value_counts()
-        total_battles = len(country_data)
-
-        # Calculate percentages for each tier
-        tier_percentages = {}
-        for tier_status in PLOTLY_BATTLE_RATING_TIER_STATUS_ORDER:
-            count = tier_counts.get(tier_status) or 0
-            percentage = (count / total_battles) * 100 if total_battles > 0 else 0
-            tier_percentages[tier_status] = {"percentage": percentage, "count": count, "total": total_battles}
-
-        country_tier_data.append(
-            {"country": country, "tier_percentages": tier_percentages, "total_battles": total_battles}
-        )
+    # Count each tier per country in one pass. The totals come from the full counts, so they still include any tiers
+    # that aren't plotted.
+    tier_counts = pd.crosstab(
+        player_performance_df["player.country"], player_performance_df["player.tier_status"]
+    ).reindex(index=sorted(available_countries), fill_value=0)
+    totals = tier_counts.sum(axis=1)
+    tier_counts = tier_counts.reindex(columns=PLOTLY_BATTLE_RATING_TIER_STATUS_ORDER, fill_value=0)
+    tier_percentages = tier_counts.div(totals, axis=0) * 100
 
     # Create the stacked bar chart
     fig = go.Figure()
@@ -53,10 +41,9 @@ def create_bar_tier_frequency_vs_country(player_performance_df: pd.DataFrame, *,
         tier_status_display = battle_rating_tier_display_builder.get_battle_rating_tier_display_from_battle_rating_tier(
             tier_status
         )
-        countries = [data["country"] for data in country_tier_data]
-        percentages = [data["tier_percentages"][tier_status]["percentage"] for data in country_tier_data]
-        counts = [data["tier_percentages"][tier_status]["count"] for data in country_tier_data]
-        totals = [data["total_battles"] for data in country_tier_data]
+        countries = tier_counts.index.tolist()
+        percentages = tier_percentages[tier_status].tolist()
+        counts = tier_counts[tier_status].tolist()
 
         # Only add bars that have data
         if any(p > 0 for p in percentages):
@@ -69,7 +56,7 @@ def create_bar_tier_frequency_vs_country(player_performance_df: pd.DataFrame, *,
                     textposition="inside",
                     textfont=dict(color="white", size=10),
                     marker_color=PLOTLY_BATTLE_RATING_TIER_STATUS_COLORS[tier_status],
-                    customdata=list(zip(counts, totals)),
+                    customdata=list(zip(counts, totals.tolist())),
                     hovertemplate=(
                         f"<b>{tier_status_display}</b><br>"
                         + "Country: %{x}<br>"
@@ -85,8 +72,7 @@ def create_bar_tier_frequency_vs_country(player_performance_df: pd.DataFrame, *,
     title_filters = OrderedDict()
     if player_name:
         title_filters["Player"] = player_name
-    total_battles = sum(data["total_battles"] for data in country_tier_data)
-    title_filters["Battles"] = total_battles
+    title_filters["Battles"] = int(totals.sum())
     if country_filters:
         title_filters[f"Countr{'y' if len(country_filters) == 1 else 'ies'}"] = ", ".join(
             [country.value for country in country_filters]
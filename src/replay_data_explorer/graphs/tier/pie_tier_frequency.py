@@ -17,11 +17,8 @@ def create_pie_tier_frequency(player_performance_df: pd.DataFrame, *, player_nam
         print("No performance data available for plotting")
         return None
 
-    # Get a copy of the data to avoid modifying the original
-    df = player_performance_df.copy()
-
     # Count the frequency of each tier status
-    tier_counts = df["player.tier_status"].value_counts()
+    tier_counts = player_performance_df["player.tier_status"].value_counts()
 
     # Ensure all tier statuses are represented (with 0 counts if necessary)
     all_tier_counts = {}
@@ -36,23 +33,13 @@ def create_pie_tier_frequency(player_performance_df: pd.DataFrame, *, player_nam
         print("No tier data found after filtering")
         return None
 
-    # Create lists for the pie chart
+    # Create lists for the pie chart, keeping the tier statuses in hand so the colors can be looked up directly
     labels = [
-        battle_rating_tier_display_builder.get_battle_rating_tier_display_from_battle_rating_tier(filtered_tier_count)
-        for filtered_tier_count in filtered_tier_counts
+        battle_rating_tier_display_builder.get_battle_rating_tier_display_from_battle_rating_tier(tier_status)
+        for tier_status in filtered_tier_counts
     ]
     values = list(filtered_tier_counts.values())
-
-    # Map colors to the labels
-    colors = []
-    for label in labels:
-        for tier_status in PLOTLY_BATTLE_RATING_TIER_STATUS_ORDER:
-            tier_status_display = (
-                battle_rating_tier_display_builder.get_battle_rating_tier_display_from_battle_rating_tier(tier_status)
-            )
-            if tier_status_display == label:
-                colors.append(PLOTLY_BATTLE_RATING_TIER_STATUS_COLORS[tier_status])
-                break
+    colors = [PLOTLY_BATTLE_RATING_TIER_STATUS_COLORS[tier_status] for tier_status in filtered_tier_counts]
 
     # Create the pie chart
     fig = go.Figure(
@@ -80,7 +67,7 @@ def create_pie_tier_frequency(player_performance_df: pd.DataFrame, *, player_nam
     title_filters = OrderedDict()
     if player_name:
         title_filters["Player"] = player_name
-    title_filters["Battles"] = len(df)
+    title_filters["Battles"] = len(player_performance_df)
     if country_filters:
         title_filters[f"Countr{'y' if len(country_filters) == 1 else 'ies'}"] = ", ".join(
             [country.value for country in country_filters]
@@ -1,6 +1,20 @@
+import numpy as np
+
 from src.replay_data_explorer.enums import BattleRatingTier
 from src.replay_data_grabber.models import Player, Replay
 
+# Tiers indexed by the bucket get_battle_rating_tiers_from_deltas sorts each delta into
+_TIERS_BY_INDEX = np.array(
+    [
+        BattleRatingTier.DOWNTIER,
+        BattleRatingTier.PARTIAL_DOWNTIER,
+        BattleRatingTier.BALANCED,
+        BattleRatingTier.PARTIAL_UPTIER,
+        BattleRatingTier.UPTIER,
+    ],
+    dtype=object,
+)
+
 
 class BattleRatingTierClassifier:
     @staticmethod
@@ -15,17 +29,35 @@ class BattleRatingTierClassifier:
         - Partial Downtier: BR > 0.6 and BR < 1.0
         - Downtier: BR == 1.0
         """
+        # Each branch only sees deltas below the previous one's bound, so only the lower bounds need checking
         if delta >= 0:
             return BattleRatingTier.DOWNTIER
-        elif 0 > delta > -0.4:
+        elif delta > -0.4:
             return BattleRatingTier.PARTIAL_DOWNTIER
-        elif -0.4 >= delta >= -0.6:
+        elif delta >= -0.6:
             return BattleRatingTier.BALANCED
-        elif -0.6 > delta > -1.0:
+        elif delta > -1.0:
             return BattleRatingTier.PARTIAL_UPTIER
         else:  # delta <= -1.0
             return BattleRatingTier.UPTIER
 
+    @staticmethod
+    def get_battle_rating_tiers_from_deltas(deltas: np.ndarray) -> np.ndarray:
+        """
+        Get the battle rating tiers for an array of deltas in one vectorized pass, using the same boundaries as
+        get_battle_rating_tier_from_delta.
+
+        Returns an object array of BattleRatingTier values with the same shape as the given deltas.
+        """
+        deltas = np.asarray(deltas, dtype=float)
+        tier_indices = np.select(
+            [deltas >= 0, deltas > -0.4, deltas >= -0.6, deltas > -1.0],
+            [0, 1, 2, 3],
+            default=4,
+        )
+
+        return _TIERS_BY_INDEX[tier_indices]
+
     @staticmethod
     def get_battle_rating_tier(player: Player, replay: Replay) -> BattleRatingTier:
         """
@@ -1,6 +1,13 @@
+import numpy as np
+
 from src.replay_data_explorer.services.battle_rating_tier_classifier import BattleRatingTierClassifier
 from src.replay_data_explorer.enums import BattleRatingTier, BattleRatingTierDisplay
 
+# Display text for each tier (the tier and display enums share member names)
+_DISPLAY_BY_TIER = {
+    BattleRatingTier[key]: display.value for key, display in BattleRatingTierDisplay.__members__.items()
+}
+
 
 class BattleRatingTierDisplayBuilder:
     @staticmethod
@@ -14,11 +21,10 @@ class BattleRatingTierDisplayBuilder:
         Returns:
             A string representing the display text of the battle rating tier.
         """
-        for key in BattleRatingTierDisplay.__members__.keys():
-            if BattleRatingTier[key] == tier:
-                return BattleRatingTierDisplay[key].value
-
-        raise ValueError(f"Invalid BattleRatingTier: {tier}")
+        try:
+            return _DISPLAY_BY_TIER[tier]
+        except KeyError:
+            raise ValueError(f"Invalid BattleRatingTier: {tier}") from None
 
     @staticmethod
     def get_battle_rating_tier_display_from_delta(delta: float) -> str:
@@ -33,3 +39,17 @@ class BattleRatingTierDisplayBuilder:
         """
         tier = BattleRatingTierClassifier.get_battle_rating_tier_from_delta(delta)
         return BattleRatingTierDisplayBuilder.get_battle_rating_tier_display_from_battle_rating_tier(tier)
+
+    @staticmethod
+    def get_battle_rating_tier_displays_from_deltas(deltas: np.ndarray) -> np.ndarray:
+        """
+        Get the display text for the battle rating tiers of an array of delta values.
+
+        Args:
+            deltas: An array of differences between players' battle ratings and their matches' battle ratings.
+
+        Returns:
+            An object array of display strings with the same shape as the given deltas.
+        """
+        tiers = BattleRatingTierClassifier.get_battle_rating_tiers_from_deltas(deltas)
+        return np.array([_DISPLAY_BY_TIER[tier] for tier in tiers.ravel()], dtype=object).reshape(tiers.shape)
@@ -1,4 +1,3 @@
-import json
 from pathlib import Path
 from typing import Optional
 
@@ -64,21 +63,12 @@ class DataLoaders:
                     print(f"Skipping player with no country in replay {Path(replay_file_path).name}")
                     continue
 
-                # Keep the shape of the replay data, but normalize it to a flat structure
-                # TODO: the replay and player models need a to_dict or maybe to_dataframe?
-                replay_data = json.loads(replay.to_json())
-                player_data = json.loads(target_player.to_json())
+                # Keep the shape of the replay data, but normalize it to a flat structure (without the players array)
+                replay_data = replay.model_dump(mode="json", exclude={"players"})
+                player_data = target_player.model_dump(mode="json")
 
-                # Remove the players array from replay data
-                if "players" in replay_data:
-                    del replay_data["players"]
-
-                # Calculate additional player metrics
-                battle_rating_delta = round(target_player.battle_rating - replay.battle_rating, 2)
-                player_data["battle_rating_delta"] = battle_rating_delta
-                player_data["tier_status"] = self.battle_rating_tier_classifier.get_battle_rating_tier_from_delta(
-                    battle_rating_delta
-                )
+                # Calculate additional player metrics (the tier status is classified for every row at once below)
+                player_data["battle_rating_delta"] = round(target_player.battle_rating - replay.battle_rating, 2)
 
                 # Flatten the structure by prefixing player fields
                 flattened_datum = replay_data.copy()
@@ -91,7 +81,7 @@ class DataLoaders:
                 print(f"Error processing {Path(replay_file_path).name}: {e}")
                 continue
 
-        return pd.DataFrame(data) if data else pd.DataFrame()
+        return self._build_performance_df(data)
 
     def get_global_performance_data(self, country_filters: list[Country] = []) -> pd.DataFrame:
         """
@@ -110,26 +100,18 @@ class DataLoaders:
         replay: Replay
         for replay_file_path, replay in loaded_replays.items():
             try:
-                # Get replay data once for this replay
-                replay_data = json.loads(replay.to_json())
-
-                # Remove the players array from replay data
-                if "players" in replay_data:
-                    del replay_data["players"]
+                # Get replay data once for this replay (without the players array)
+                replay_data = replay.model_dump(mode="json", exclude={"players"})
 
                 # Process each player in the replay
                 for player in replay.players:
                     if country_filters and player.country not in country_filters:
                         continue
 
-                    player_data = json.loads(player.to_json())
+                    player_data = player.model_dump(mode="json")
 
-                    # Calculate additional player metrics
-                    battle_rating_delta = round(player.battle_rating - replay.battle_rating, 2)
-                    player_data["battle_rating_delta"] = battle_rating_delta
-                    player_data["tier_status"] = self.battle_rating_tier_classifier.get_battle_rating_tier_from_delta(
-                        battle_rating_delta
-                    )
+                    # Calculate additional player metrics (the tier status is classified for every row at once below)
+                    player_data["battle_rating_delta"] = round(player.battle_rating - replay.battle_rating, 2)
 
                     # Flatten the structure by prefixing player fields
                     flattened_datum = replay_data.copy()
@@ -142,4 +124,28 @@ class DataLoaders:
                 print(f"Error processing {Path(replay_file_path).name}: {e}")
                 continue
 
-        return pd.DataFrame(data) if data else pd.DataFrame()
+        return self._build_performance_df(data)
+
+    def _build_performance_df(self, data: list[dict]) -> pd.DataFrame:
+        """
+        Build a performance DataFrame from flattened replay data, classifying every row's tier status in one pass.
+
+        Args:
+            data: List of flattened replay and player data, as built by the get_*_performance_data methods
+
+        Returns:
+            DataFrame with the replay data and a "player.tier_status" column alongside the battle rating deltas
+        """
+        if not data:
+            return pd.DataFrame()
+
+        df = pd.DataFrame(data)
+        df.insert(
+            df.columns.get_loc("player.battle_rating_delta") + 1,
+            "player.tier_status",
+            self.battle_rating_tier_classifier.get_battle_rating_tiers_from_deltas(
+                df["player.battle_rating_delta"].to_numpy()
+            ),
+        )
+
+        return df
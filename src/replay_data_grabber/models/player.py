@@ -45,15 +45,15 @@ class Player(SerializableModel):
     missile_evades: int = Field(default=0)
 
     # Vehicle lineup
-    lineup: list[str] = Field(default_factory=list)
+    lineup: tuple[str, ...] = Field(default=())
     is_premium: bool = Field(
         default=False, description="Indicates if the player has any premium vehicles in their lineup"
     )
 
     def model_post_init(self, __context) -> None:
-        """Initialize lineup list if None."""
+        """Initialize lineup tuple if None."""
         if self.lineup is None:
-            self.lineup = []
+            self.lineup = ()
 
     @property
     def kill_death_ratio(self) -> float:
@@ -70,8 +70,4 @@ class Replay(SerializableModel):
         file_name_parts.append(self.session_id)
 
         file_path = directory / f"{'_'.join(file_name_parts)}.json"
-        replay_json = self.model_dump_json(indent=2)
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(replay_json)
-
-        return file_path
+        return self.write_to_file(file_path)
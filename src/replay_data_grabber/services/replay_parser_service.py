@@ -4,7 +4,7 @@ logger = logging.getLogger(__name__)
 
 import struct
 from datetime import datetime
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Sequence
 from pathlib import Path
 
 from src.common.enums import BattleType, PlatformType, Country
@@ -242,7 +242,7 @@ class ReplayParserService:
                 replay.battle_rating = player.battle_rating
 
     def _get_player_battle_rating(
-        self, lineup: list[str], battle_type: BattleType, *, battle_datetime: Optional[datetime] = None
+        self, lineup: Sequence[str], battle_type: BattleType, *, battle_datetime: Optional[datetime] = None
     ) -> float:
         """
         Get the battle rating for a player's vehicle lineup.
@@ -256,7 +256,7 @@ class ReplayParserService:
         raise ValueError(f"Unable to determine battle rating for lineup: {lineup} and battle_type: {battle_type}")
 
     def _get_player_min_battle_rating(
-        self, lineup: list[str], battle_type: BattleType, *, battle_datetime: Optional[datetime] = None
+        self, lineup: Sequence[str], battle_type: BattleType, *, battle_datetime: Optional[datetime] = None
     ) -> float:
         """
         Get the minimum battle rating for a player's vehicle lineup.
@@ -272,7 +272,7 @@ class ReplayParserService:
         )
 
     def _get_player_mean_battle_rating(
-        self, lineup: list[str], battle_type: BattleType, *, battle_datetime: Optional[datetime] = None
+        self, lineup: Sequence[str], battle_type: BattleType, *, battle_datetime: Optional[datetime] = None
     ) -> float:
         """
         Get the mean battle rating for a player's vehicle lineup.
@@ -292,7 +292,7 @@ class ReplayParserService:
     def _get_transformed_player_battle_rating(
         self,
         transform_func: Callable,
-        lineup: list[str],
+        lineup: Sequence[str],
         battle_type: BattleType,
         *,
         battle_datetime: Optional[datetime] = None,
@@ -300,14 +300,12 @@ class ReplayParserService:
         """
         Get the battle rating for a player's vehicle lineup.
         """
-        vehicles = []
+        battle_ratings = []
         for vehicle_name in lineup:
             vehicle = self._vehicle_service.get_vehicles_by_internal_name(vehicle_name, search_datetime=battle_datetime)
-            if vehicle:
-                vehicles.append(vehicle)
+            if not vehicle:
+                continue
 
-        battle_ratings = []
-        for vehicle in vehicles:
             if battle_type == BattleType.ARCADE:
                 battle_ratings.append(vehicle.battle_rating.arcade)
             elif battle_type == BattleType.REALISTIC:
@@ -371,7 +369,7 @@ class ReplayParserService:
 
         # Vehicle lineup
         crafts = player_info.get("crafts", {})
-        player.lineup = list(crafts.values())
+        player.lineup = tuple(crafts.values())
         player.is_premium = self._vehicle_service.is_vehicle_premium(player.lineup, search_datetime=start_time)
 
         # Replay metadata